@@ -7,6 +7,7 @@ block_cipher = None
 datas = [
     ('bin', 'bin'),
     ('doc_validator/resources', 'doc_validator/resources'),
+    ('doc_validator/interface/styles/dark.qss', 'doc_validator/interface/styles'),
 ]
 
 # Hidden imports for packages that might not be detected
@@ -15,6 +16,8 @@ hidden_imports = [
     'googleapiclient.http',
     'pandas',
     'openpyxl',
+    'python_calamine',
+    'xlsxwriter',
     'PyQt6.QtCore',
     'PyQt6.QtGui',
     'PyQt6.QtWidgets',
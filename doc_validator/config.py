@@ -1,4 +1,6 @@
+import os
 from pathlib import Path
+import re
 import sys
 
 # ------------------------------------------------------------
@@ -19,24 +21,68 @@ else:
 LINK_FILE = str(BASE_DIR / "bin" / "link.txt")
 
 # ------------------------------------------------------------
-# Data folder (always created next to exe)
+# Data folder (created next to exe by ensure_folders())
 # ------------------------------------------------------------
 DATA_FOLDER = str(BASE_DIR / "DATA")
-Path(DATA_FOLDER).mkdir(exist_ok=True)
 
 # ------------------------------------------------------------
 # Input folder (for local Excel files)
 # ------------------------------------------------------------
 INPUT_FOLDER = str(BASE_DIR / "INPUT")
-Path(INPUT_FOLDER).mkdir(exist_ok=True)
 
 # Subfolder for log inside each WP folder
 LOG_FOLDER = "log"
 
+
+def ensure_folders():
+    """Create DATA_FOLDER and INPUT_FOLDER; call once from each entry point."""
+    Path(DATA_FOLDER).mkdir(exist_ok=True)
+    Path(INPUT_FOLDER).mkdir(exist_ok=True)
+
+
 # ------------------------------------------------------------
 # Other constants
 # ------------------------------------------------------------
 INVALID_CHARACTERS = r'[\\/*?:"<>|]'
+INVALID_CHARACTERS_RE = re.compile(INVALID_CHARACTERS)
+
+# ------------------------------------------------------------
+# Google Drive download settings
+# ------------------------------------------------------------
+# Number of files downloaded concurrently (kept small to stay
+# under Drive's per-user request quota)
+DRIVE_DOWNLOAD_MAX_WORKERS = 4
+
+# Bytes fetched per HTTP range request (library default is 100 KB)
+DRIVE_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Write buffer for downloaded files, so chunks reach disk in large writes
+DRIVE_DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+
+# Retries per chunk on connection resets / 5xx responses
+DRIVE_DOWNLOAD_NUM_RETRIES = 5
+
+# Files up to this size are fetched with one GET instead of the
+# chunked downloader (typical WP workbooks are well below it)
+DRIVE_SIMPLE_DOWNLOAD_MAX_BYTES = 50 * 1024 * 1024
+
+# Entries requested per files.list page (Drive maximum is 1000)
+DRIVE_LIST_PAGE_SIZE = 1000
+
+# Calls combined into one batch request (Drive maximum is 100)
+DRIVE_BATCH_MAX_REQUESTS = 100
+
+# Last Drive folder listing, shown immediately while the GUI re-lists
+# the folder in the background; ignored once older than the max age
+DRIVE_LIST_CACHE_FILE = str(BASE_DIR / "bin" / "drive_cache.json")
+DRIVE_LIST_CACHE_MAX_AGE = 300  # seconds
+
+# ------------------------------------------------------------
+# Batch processing settings
+# ------------------------------------------------------------
+# Worker processes used to validate downloaded files in parallel
+# (capped at the number of files; 1 processes them serially)
+PROCESS_MAX_WORKERS = os.cpu_count() or 1
 
 # ------------------------------------------------------------
 # Action Step Control settings
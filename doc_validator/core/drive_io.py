@@ -4,38 +4,176 @@ Google Drive utilities for downloading files.
 
 - Authenticate with Google Drive API using an API key
 - List all Excel files in a folder
-- Download single or multiple Excel files
+- Download single or multiple Excel files (multiple files in parallel)
 - Read API key and folder ID from a credentials file (link.txt)
 """
 
-import io
+import hashlib
+import json
+import logging
 import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
 
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload, build_http
+
+from doc_validator.config import (
+    DATA_FOLDER,
+    DRIVE_BATCH_MAX_REQUESTS,
+    DRIVE_DOWNLOAD_CHUNK_SIZE,
+    DRIVE_DOWNLOAD_MAX_WORKERS,
+    DRIVE_DOWNLOAD_NUM_RETRIES,
+    DRIVE_DOWNLOAD_WRITE_BUFFER,
+    DRIVE_LIST_PAGE_SIZE,
+    DRIVE_SIMPLE_DOWNLOAD_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limits and transient server errors.
+# 403 is only retried when Drive reports a rate-limit reason.
+RETRYABLE_STATUSES = {403, 429, 500, 502, 503}
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+# Sidecar written next to each downloaded file with its Drive metadata,
+# used to skip re-downloading files that have not changed
+CACHE_META_SUFFIX = ".meta.json"
+CACHE_META_FIELDS = ("modifiedTime", "size", "md5Checksum")
+
+# Per-thread state: httplib2.Http objects (and the services built on
+# them) are not thread-safe, so each thread gets its own connection and
+# its own cached Drive service.
+_thread_local = threading.local()
+
+
+def get_thread_http():
+    """Return the httplib2.Http instance owned by the calling thread."""
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = build_http()
+        _thread_local.http = http
+    return http
+
+
+class _BackgroundWriter:
+    """
+    File-like object that hands written chunks to a writer thread.
 
-from doc_validator.config import DATA_FOLDER
+    MediaIoBaseDownload writes each chunk before requesting the next one;
+    queueing the write lets the next HTTP range request overlap with the
+    disk write. At most max_pending chunks are held in memory.
+    """
+
+    def __init__(self, fh, max_pending=2):
+        self._fh = fh
+        self._chunks = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        while True:
+            data = self._chunks.get()
+            if data is None:
+                return
+            # After a failed write keep draining so write() never blocks
+            if self._error is None:
+                try:
+                    self._fh.write(data)
+                except Exception as e:  # pragma: no cover - runtime-only path
+                    self._error = e
+
+    def write(self, data):
+        if self._error is not None:
+            raise self._error
+        self._chunks.put(data)
+        return len(data)
+
+    def close(self):
+        """Wait for queued chunks to be written; re-raise any write error."""
+        self._chunks.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def _is_retryable(error):
+    """Return True if an HttpError is a rate limit or transient server error."""
+    status = error.resp.status
+    if status not in RETRYABLE_STATUSES:
+        return False
+    if status == 403:
+        # Plain 403s (permission denied, file not shared) never recover
+        content = error.content or b""
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+        return any(reason in content for reason in RATE_LIMIT_REASONS)
+    return True
+
+
+def _with_backoff(fn, max_tries=6):
+    """
+    Call fn(), retrying with truncated exponential backoff on Drive
+    rate-limit and transient server errors (see RETRYABLE_STATUSES).
+
+    Args:
+        fn: Zero-argument callable performing the Drive request
+        max_tries: Maximum number of attempts
+
+    Returns:
+        Whatever fn() returns
+    """
+    for attempt in range(max_tries):
+        try:
+            return fn()
+        except HttpError as e:
+            if not _is_retryable(e) or attempt == max_tries - 1:
+                raise
+            delay = min(2 ** attempt, 32) + random.random()
+            logger.warning(
+                "Drive request failed with HTTP %s, retrying in %.1fs",
+                e.resp.status, delay,
+            )
+            time.sleep(delay)
 
 
 def authenticate_drive_api(api_key):
     """
     Authenticate with Google Drive API using API Key.
 
+    The service is cached per thread and API key, so the discovery
+    document is only fetched the first time a thread asks for it.
+
     Args:
         api_key: Google Drive API key
 
     Returns:
         drive_service: Authenticated Google Drive service
     """
-    # static_discovery=False forces the client to fetch the discovery
-    # document from Google's servers instead of using a local JSON file
-    # (which is missing in the PyInstaller bundle).
-    drive_service = build(
-        "drive",
-        "v3",
-        developerKey=api_key,
-        static_discovery=False,
-    )
+    services = getattr(_thread_local, "services", None)
+    if services is None:
+        services = _thread_local.services = {}
+
+    drive_service = services.get(api_key)
+    if drive_service is None:
+        # static_discovery=False forces the client to fetch the discovery
+        # document from Google's servers instead of using a local JSON file
+        # (which is missing in the PyInstaller bundle).
+        drive_service = build(
+            "drive",
+            "v3",
+            developerKey=api_key,
+            static_discovery=False,
+        )
+        services[api_key] = drive_service
+
     return drive_service
 
 
@@ -44,6 +182,7 @@ def get_all_excel_files_from_folder(drive_service, folder_id):
     Get all Excel file IDs from the folder.
 
     FIXED: Gets ALL files from folder and filters by extension instead of MIME type.
+    Follows nextPageToken so folders larger than one page are fully listed.
 
     Args:
         drive_service: Authenticated Google Drive service
@@ -51,22 +190,32 @@ def get_all_excel_files_from_folder(drive_service, folder_id):
 
     Returns:
         list[dict]: List of file info dicts:
-            [{'id': <str>, 'name': <str>, 'mimeType': <str>}, ...]
+            [{'id': <str>, 'name': <str>, 'mimeType': <str>, 'size': <str>,
+              'md5Checksum': <str>, 'modifiedTime': <str>}, ...]
     """
     query = f"'{folder_id}' in parents and trashed=false"
 
     try:
-        results = (
-            drive_service.files()
-            .list(
+        all_files = []
+        page_token = None
+
+        while True:
+            request = drive_service.files().list(
                 q=query,
-                fields="files(id, name, mimeType)",
+                fields=(
+                    "nextPageToken, "
+                    "files(id, name, mimeType, size, md5Checksum, modifiedTime)"
+                ),
                 orderBy="name",
+                pageSize=DRIVE_LIST_PAGE_SIZE,
+                pageToken=page_token,
             )
-            .execute()
-        )
+            results = _with_backoff(request.execute)
 
-        all_files = results.get("files", [])
+            all_files.extend(results.get("files", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
 
         if not all_files:
             print("No files found in the folder.")
@@ -84,9 +233,11 @@ def get_all_excel_files_from_folder(drive_service, folder_id):
             print(f"Found {len(all_files)} total file(s), but none are .xlsx or .xls")
             return []
 
-        print(f"\n📁 Found {len(excel_files)} Excel file(s) in folder:")
-        for i, file in enumerate(excel_files, 1):
-            print(f"   {i}. {file['name']}")
+        # One write for the whole listing instead of one per file
+        listing = "\n".join(
+            f"   {i}. {file['name']}" for i, file in enumerate(excel_files, 1)
+        )
+        print(f"\n📁 Found {len(excel_files)} Excel file(s) in folder:\n{listing}")
 
         return excel_files
 
@@ -95,6 +246,49 @@ def get_all_excel_files_from_folder(drive_service, folder_id):
         return []
 
 
+def get_files_metadata(drive_service, file_ids):
+    """
+    Fetch metadata for several files using batched files.get calls.
+
+    Up to DRIVE_BATCH_MAX_REQUESTS lookups are sent per multipart batch
+    request, instead of one HTTP round-trip per file.
+
+    Args:
+        drive_service: Authenticated Google Drive service
+        file_ids: Iterable of Google Drive file IDs
+
+    Returns:
+        dict[str, dict]: file_id -> {'id', 'name', 'size', 'md5Checksum',
+            'modifiedTime'}; files whose lookup failed are left out
+    """
+    file_ids = list(dict.fromkeys(file_ids))  # batch request ids must be unique
+    metadata = {}
+
+    def _callback(request_id, response, exception):
+        if exception is not None:
+            logger.warning("Metadata lookup failed for %s: %s", request_id, exception)
+            return
+        metadata[request_id] = response
+
+    for start in range(0, len(file_ids), DRIVE_BATCH_MAX_REQUESTS):
+        batch = drive_service.new_batch_http_request(callback=_callback)
+        for file_id in file_ids[start:start + DRIVE_BATCH_MAX_REQUESTS]:
+            batch.add(
+                drive_service.files().get(
+                    fileId=file_id,
+                    fields="id, name, size, md5Checksum, modifiedTime",
+                ),
+                request_id=file_id,
+            )
+
+        try:
+            _with_backoff(batch.execute)
+        except Exception as e:  # pragma: no cover - runtime-only path
+            logger.warning("Batch metadata request failed: %s", e)
+
+    return metadata
+
+
 def get_file_id_from_folder(drive_service, folder_id):
     """
     LEGACY: Get the first file ID from the folder.
@@ -107,14 +301,11 @@ def get_file_id_from_folder(drive_service, folder_id):
     Returns:
         file_id: ID of the first file in the folder, or None if no files found
     """
-    results = (
-        drive_service.files()
-        .list(
-            q=f"'{folder_id}' in parents",
-            fields="files(id, name)",
-        )
-        .execute()
+    request = drive_service.files().list(
+        q=f"'{folder_id}' in parents",
+        fields="files(id, name)",
     )
+    results = _with_backoff(request.execute)
 
     files = results.get("files", [])
     if not files:
@@ -126,7 +317,166 @@ def get_file_id_from_folder(drive_service, folder_id):
     return file_id
 
 
-def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
+def _md5_of_file(file_path):
+    """Return the hex MD5 digest of a local file, read in 1 MiB blocks."""
+    digest = hashlib.md5()
+    with open(file_path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_cached(file_path, file_meta, verify_md5=False):
+    """
+    Check whether file_path already holds the Drive revision in file_meta.
+
+    Compares the remote modifiedTime and size with the sidecar written by
+    the previous download (and the local file size). With verify_md5,
+    the local file is also hashed and compared with md5Checksum.
+
+    Args:
+        file_path: Local path of the previously downloaded file
+        file_meta: Drive metadata dict from files.list
+        verify_md5: Also verify the local file's MD5 checksum
+
+    Returns:
+        bool: True if the local copy can be reused
+    """
+    if not file_meta or not file_meta.get("modifiedTime"):
+        return False
+
+    try:
+        with open(file_path + CACHE_META_SUFFIX, "r", encoding="utf-8") as fh:
+            cached_meta = json.load(fh)
+        local_size = os.path.getsize(file_path)
+    except (OSError, ValueError):
+        return False
+
+    if cached_meta.get("modifiedTime") != file_meta["modifiedTime"]:
+        return False
+
+    remote_size = file_meta.get("size")
+    if remote_size is not None and int(remote_size) != local_size:
+        return False
+
+    if verify_md5 and file_meta.get("md5Checksum"):
+        return _md5_of_file(file_path) == file_meta["md5Checksum"]
+
+    return True
+
+
+def _write_cache_meta(file_path, file_meta):
+    """Record the Drive metadata of a freshly downloaded file."""
+    meta = {key: file_meta.get(key) for key in CACHE_META_FIELDS}
+    try:
+        with open(file_path + CACHE_META_SUFFIX, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+    except OSError as e:  # pragma: no cover - runtime-only path
+        logger.warning("Could not write cache metadata for %s: %s", file_path, e)
+
+
+def _download_file_to_path(
+        drive_service,
+        file_id,
+        file_path,
+        http=None,
+        file_size=None,
+        file_meta=None,
+        verify_md5=False,
+):
+    """
+    Download a Drive file to file_path; the parent folder must already exist.
+
+    When file_meta (the file's entry from files.list) is given, an
+    unchanged local copy is reused instead of downloading it again.
+
+    Files whose size is known and at most DRIVE_SIMPLE_DOWNLOAD_MAX_BYTES
+    are fetched with a single GET; larger or unknown-size files use the
+    chunked downloader.
+
+    Args:
+        drive_service: Authenticated Google Drive service
+        file_id: Google Drive file ID to download
+        file_path: Destination path on disk
+        http: Optional httplib2.Http to send the request with
+              (required when downloading from several threads)
+        file_size: Optional file size in bytes (Drive 'size' field)
+        file_meta: Optional Drive metadata used for the local cache check
+        verify_md5: Also compare MD5 checksums before reusing a cached file
+
+    Returns:
+        file_path: Path to the downloaded file, or None on error
+    """
+    if _is_cached(file_path, file_meta, verify_md5=verify_md5):
+        print(f"   ✓ Unchanged on Drive, using cached copy: {file_path}")
+        return file_path
+
+    if file_meta:
+        # Drop any stale sidecar so a failed download is never reused
+        try:
+            os.remove(file_path + CACHE_META_SUFFIX)
+        except FileNotFoundError:
+            pass
+
+    simple = (
+        file_size is not None
+        and int(file_size) <= DRIVE_SIMPLE_DOWNLOAD_MAX_BYTES
+    )
+
+    def _download():
+        request = drive_service.files().get_media(fileId=file_id)
+        if http is not None:
+            request.http = http
+
+        if simple:
+            # One GET for the whole body, one write to disk
+            content = request.execute(num_retries=DRIVE_DOWNLOAD_NUM_RETRIES)
+            with open(file_path, "wb") as fh:
+                fh.write(content)
+            return
+
+        with open(file_path, "wb", buffering=DRIVE_DOWNLOAD_WRITE_BUFFER) as fh:
+            writer = _BackgroundWriter(fh)
+            try:
+                downloader = MediaIoBaseDownload(
+                    writer,
+                    request,
+                    chunksize=DRIVE_DOWNLOAD_CHUNK_SIZE,
+                )
+                done = False
+
+                while not done:
+                    status, done = downloader.next_chunk(
+                        num_retries=DRIVE_DOWNLOAD_NUM_RETRIES
+                    )
+            finally:
+                writer.close()
+
+    try:
+        # No _with_backoff here: execute() / next_chunk() already retry
+        # rate limits, 5xx and connection errors themselves (num_retries),
+        # per chunk rather than restarting the whole file
+        _download()
+        if file_meta:
+            _write_cache_meta(file_path, file_meta)
+        print(f"   ✓ Downloaded to: {file_path}")
+        return file_path
+
+    except Exception as e:  # pragma: no cover - runtime-only path
+        print(f"   ❌ Error downloading file: {str(e)}")
+        return None
+
+
+def download_file_from_drive(
+        drive_service,
+        file_id,
+        wp_value,
+        file_name=None,
+        http=None,
+        file_size=None,
+        file_meta=None,
+        verify_md5=False,
+):
     """
     Download file from Google Drive to a specific folder.
 
@@ -135,6 +485,12 @@ def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
         file_id: Google Drive file ID to download
         wp_value: Work package value for folder naming
         file_name: Optional custom filename (if None, uses default naming)
+        http: Optional httplib2.Http to send the request with
+              (required when downloading from several threads)
+        file_size: Optional file size in bytes (Drive 'size' field)
+        file_meta: Optional Drive metadata (see get_files_metadata); an
+                   unchanged local copy is reused instead of downloaded
+        verify_md5: Also compare MD5 checksums before reusing a cached file
 
     Returns:
         file_path: Path to the downloaded file, or None on error
@@ -149,33 +505,49 @@ def download_file_from_drive(drive_service, file_id, wp_value, file_name=None):
     else:
         file_path = os.path.join(wp_folder, f"WP_{wp_value}_RAW.xlsx")
 
-    try:
-        request = drive_service.files().get_media(fileId=file_id)
-        fh = io.FileIO(file_path, "wb")
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-
-        while not done:
-            status, done = downloader.next_chunk()
+    return _download_file_to_path(
+        drive_service,
+        file_id,
+        file_path,
+        http=http,
+        file_size=file_size if file_size is not None else (file_meta or {}).get("size"),
+        file_meta=file_meta,
+        verify_md5=verify_md5,
+    )
 
-        print(f"   ✓ Downloaded to: {file_path}")
-        return file_path
 
-    except Exception as e:  # pragma: no cover - runtime-only path
-        print(f"   ❌ Error downloading file: {str(e)}")
-        return None
+def _downloaded_info(file, file_path):
+    """Info dict reported for one downloaded file."""
+    return {"path": file_path, "name": file["name"], "id": file["id"]}
 
 
-def download_all_excel_files(drive_service, folder_id):
+def download_all_excel_files(
+        drive_service,
+        folder_id,
+        max_workers=DRIVE_DOWNLOAD_MAX_WORKERS,
+        verify_md5=False,
+        on_downloaded=None,
+):
     """
     Download all Excel files from a Google Drive folder.
 
+    Files are downloaded concurrently by a small thread pool; each worker
+    thread uses its own HTTP connection. Files whose Drive modifiedTime
+    and size match the previous download are not fetched again.
+
+    on_downloaded, if given, is called on the calling thread with each
+    file's info dict as soon as that file is on disk, so callers can start
+    processing it while the remaining downloads continue.
+
     Args:
         drive_service: Authenticated Google Drive service
         folder_id: Google Drive folder ID
+        max_workers: Maximum number of concurrent downloads
+        verify_md5: Also compare MD5 checksums before reusing cached files
+        on_downloaded: Optional callback taking one downloaded file info dict
 
     Returns:
-        list[dict]: List of downloaded file info:
+        list[dict]: List of downloaded file info (in folder listing order):
             [{'path': <local_path>, 'name': <filename>, 'id': <file_id>}, ...]
     """
     files = get_all_excel_files_from_folder(drive_service, folder_id)
@@ -183,31 +555,50 @@ def download_all_excel_files(drive_service, folder_id):
     if not files:
         return []
 
-    downloaded_files = []
-
     print(f"\n📥 Downloading {len(files)} file(s)...\n")
 
-    for i, file in enumerate(files, 1):
-        print(f"[{i}/{len(files)}] Downloading: {file['name']}")
+    # Use 'temp_download' folder for the batch download
+    download_folder = os.path.join(DATA_FOLDER, "temp_download")
 
-        # Use 'temp_download' folder for the batch download
-        file_path = download_file_from_drive(
+    def _download_one(file):
+        # One sub-folder per file ID: Drive allows duplicate names, and
+        # same-name files must not share a path while downloading in parallel
+        file_folder = os.path.join(download_folder, file["id"])
+        os.makedirs(file_folder, exist_ok=True)
+        return _download_file_to_path(
             drive_service,
             file["id"],
-            "temp_download",
-            file["name"],  # Preserve original filename
+            os.path.join(file_folder, file["name"]),  # Preserve original filename
+            http=get_thread_http(),
+            file_size=file.get("size"),
+            file_meta=file,
+            verify_md5=verify_md5,
         )
 
-        if file_path:
-            downloaded_files.append(
-                {
-                    "path": file_path,
-                    "name": file["name"],
-                    "id": file["id"],
-                }
-            )
-        else:
-            print("   ⚠️  Skipping file due to download error")
+    paths_by_index = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(_download_one, file): i
+            for i, file in enumerate(files)
+        }
+
+        for done_count, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            file = files[i]
+            file_path = future.result()
+            if file_path:
+                paths_by_index[i] = file_path
+                print(f"[{done_count}/{len(files)}] Finished: {file['name']}")
+                if on_downloaded is not None:
+                    on_downloaded(_downloaded_info(file, file_path))
+            else:
+                print("   ⚠️  Skipping file due to download error")
+
+    downloaded_files = [
+        _downloaded_info(files[i], paths_by_index[i])
+        for i in sorted(paths_by_index)
+    ]
 
     print(f"\n✓ Downloaded {len(downloaded_files)} file(s) successfully!")
 
@@ -217,6 +608,21 @@ def download_all_excel_files(drive_service, folder_id):
     return downloaded_files
 
 
+@lru_cache(maxsize=4)
+def _parse_credentials(path, mtime_ns):
+    """Parse a credentials file; cached until its mtime changes."""
+    text = Path(path).read_text(encoding="utf-8")
+    values = dict(
+        line.split("=", 1)
+        for line in text.splitlines()
+        if line.startswith("GG_") and "=" in line
+    )
+
+    api_key = values.get("GG_API_KEY", "").strip() or None
+    folder_id = values.get("GG_FOLDER_ID", "").strip() or None
+    return api_key, folder_id
+
+
 def read_credentials_file(filename):
     """
     Read API key and folder ID from credentials file.
@@ -225,27 +631,18 @@ def read_credentials_file(filename):
         GG_API_KEY=xxxx
         GG_FOLDER_ID=yyyy
 
+    The parsed values are cached by absolute path and modification
+    time, so repeated calls only cost one stat() until the file is edited.
+
     Args:
         filename: Path to credentials file
 
     Returns:
         tuple[str | None, str | None]: (api_key, folder_id)
     """
+    path = os.path.abspath(filename)
     try:
-        with open(filename, "r") as file:
-            content = file.readlines()
-
-        api_key = None
-        folder_id = None
-
-        for line in content:
-            if line.startswith("GG_API_KEY="):
-                api_key = line.split("=", 1)[1].strip()
-            elif line.startswith("GG_FOLDER_ID="):
-                folder_id = line.split("=", 1)[1].strip()
-
-        return api_key, folder_id
-
+        return _parse_credentials(path, os.stat(path).st_mtime_ns)
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
         return None, None
@@ -1,18 +1,66 @@
 # doc_validator/core/excel_io.py
 
 import os
-import re
+import threading
 from datetime import datetime
+from itertools import chain
+from importlib.util import find_spec
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.utils import get_column_letter
 
-from doc_validator.config import DATA_FOLDER, LOG_FOLDER, INVALID_CHARACTERS
+from doc_validator.config import DATA_FOLDER, LOG_FOLDER, INVALID_CHARACTERS_RE
+
+# python-calamine (Rust) parses xlsx several times faster than openpyxl;
+# use it when installed, otherwise fall back to openpyxl.
+EXCEL_READ_ENGINE = "calamine" if find_spec("python_calamine") else "openpyxl"
+
+# xlsxwriter writes xlsx noticeably faster than openpyxl; same fallback.
+EXCEL_WRITE_ENGINE = "xlsxwriter" if find_spec("xlsxwriter") else "openpyxl"
+
+
+def _arrow_string_dtype():
+    """
+    Return a PyArrow-backed string dtype with NaN missing-value semantics,
+    or None if pyarrow (or a pandas version supporting it) is unavailable.
+
+    NaN semantics keep comparisons like ``df[col] == "x"`` returning plain
+    booleans, exactly as with the object-dtype strings used before.
+    """
+    if find_spec("pyarrow") is None:
+        return None
+    try:
+        return pd.StringDtype("pyarrow", na_value=float("nan"))  # pandas >= 2.3
+    except TypeError:
+        pass
+    try:
+        return pd.StringDtype("pyarrow_numpy")  # pandas 2.1 - 2.2
+    except (TypeError, ValueError):
+        return None
+
+
+# Arrow strings use far less memory than Python str objects and speed up
+# the .str operations in the pipeline; plain str is the fallback.
+INPUT_STRING_DTYPE = _arrow_string_dtype() or str
+
+# Serializes read-modify-write of the monthly logbook. Worker processes
+# replace it with a shared multiprocessing lock (see set_logbook_lock).
+_logbook_lock = threading.Lock()
+
+
+def set_logbook_lock(lock) -> None:
+    """Use ``lock`` to guard logbook appends (e.g. a multiprocessing.Lock)."""
+    global _logbook_lock
+    _logbook_lock = lock
 
 
 def sanitize_folder_name(wp_value: str) -> str:
     """Clean folder name by removing invalid characters."""
     if isinstance(wp_value, str) and wp_value.strip():
-        cleaned_wp_value = re.sub(INVALID_CHARACTERS, "_", wp_value)
+        cleaned_wp_value = INVALID_CHARACTERS_RE.sub("_", wp_value)
         return cleaned_wp_value
     return "No_wp_found"
 
@@ -93,14 +141,20 @@ def create_log_file(wp_value, output_file, counts, processing_time=None):
     print(f"✓ Legacy txt log file created: {log_filename}")
 
 
-def append_to_logbook(wp_value, counts, processing_time=None):
+def append_to_logbook(wp_value, counts, processing_time=None, run_time=None):
     """
     Append one run to a monthly Excel logbook.
 
+    run_time is the timestamp of the whole batch; pass the same value for
+    every file of a run so they share one DateTime and logbook month.
+    Defaults to now.
+
     - File name format: logbook_YYYY_MM.xlsx
     - Stored under: DATA/LOG_FOLDER (e.g. DATA/log/logbook_2025_11.xlsx)
+    - Existing logbooks get one appended row (matched to the header
+      by column name) instead of being re-read and rewritten via pandas
     """
-    now = datetime.now()
+    now = run_time or datetime.now()
     month_str = now.strftime("%Y_%m")  # e.g., 2025_11
 
     logbook_folder = os.path.join(DATA_FOLDER, LOG_FOLDER)
@@ -140,15 +194,25 @@ def append_to_logbook(wp_value, counts, processing_time=None):
         else None,
     }
 
-    if os.path.exists(logbook_path):
-        existing_df = pd.read_excel(logbook_path)
-        row["Order"] = len(existing_df) + 1
-        df = pd.concat([existing_df, pd.DataFrame([row])], ignore_index=True)
-    else:
-        row["Order"] = 1
-        df = pd.DataFrame([row])
+    with _logbook_lock:
+        if os.path.exists(logbook_path):
+            workbook = load_workbook(logbook_path)
+            sheet = workbook.active
+
+            header = [cell.value for cell in sheet[1]]
+            for column_name in row:
+                if column_name not in header:
+                    header.append(column_name)
+                    sheet.cell(row=1, column=len(header), value=column_name)
+
+            # max_row counts the header, so it equals the number of runs + 1
+            row["Order"] = sheet.max_row
+            sheet.append([row.get(column_name) for column_name in header])
+            workbook.save(logbook_path)
+        else:
+            row["Order"] = 1
+            pd.DataFrame([row]).to_excel(logbook_path, index=False)
 
-    df.to_excel(logbook_path, index=False)
     print(f"✓ Logbook updated: {logbook_path}")
 
 
@@ -156,14 +220,18 @@ def read_input_excel(file_path: str) -> pd.DataFrame:
     """
     Read the input Excel file with the strict settings used in the original code,
     to avoid data loss.
+
+    Uses the calamine engine when python-calamine is installed (see
+    EXCEL_READ_ENGINE), openpyxl otherwise, and Arrow-backed strings
+    when pyarrow is installed (see INPUT_STRING_DTYPE).
     """
     df = pd.read_excel(
         file_path,
-        engine="openpyxl",
+        engine=EXCEL_READ_ENGINE,
         header=0,
         sheet_name=0,
         keep_default_na=False,  # Keep "N/A" as literal
-        dtype=str,  # Read everything as string
+        dtype=INPUT_STRING_DTYPE,  # Read everything as string
         na_filter=False,  # Do not convert to NaN
     )
     return df
@@ -177,22 +245,36 @@ def reread_original_for_debug(file_path: str) -> pd.DataFrame:
     return read_input_excel(file_path)
 
 
-def save_debug_input_output(file_path: str, df_processed: pd.DataFrame) -> None:
+def save_debug_input_output(
+        file_path: str,
+        df_processed: pd.DataFrame,
+        df_original: pd.DataFrame | None = None,
+) -> None:
     """
     Save input and output CSVs to a DEBUG folder for row loss diagnosis.
+
+    Pass the DataFrame already returned by read_input_excel() as
+    df_original to skip parsing the workbook a second time.
     """
     debug_folder = os.path.join(os.path.dirname(file_path), "DEBUG")
     os.makedirs(debug_folder, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    df_original = reread_original_for_debug(file_path)
+    if df_original is None:
+        df_original = reread_original_for_debug(file_path)
 
     debug_input = os.path.join(debug_folder, f"input_original_{timestamp}.csv")
     debug_output = os.path.join(debug_folder, f"output_processed_{timestamp}.csv")
 
-    df_original.to_csv(debug_input, index=False, encoding="utf-8")
-    df_processed.to_csv(debug_output, index=False, encoding="utf-8")
+    csv_options = {
+        "index": False,
+        "encoding": "utf-8",
+        "lineterminator": "\n",
+        "chunksize": 50_000,
+    }
+    df_original.to_csv(debug_input, **csv_options)
+    df_processed.to_csv(debug_output, **csv_options)
 
     print("      Debug files saved:")
     print(f"        Input:  {debug_input}")
@@ -200,21 +282,148 @@ def save_debug_input_output(file_path: str, df_processed: pd.DataFrame) -> None:
     print("      Compare these files to find missing rows!")
 
 
-def build_output_path(wp_value: str) -> tuple[str, str]:
+def build_output_path(
+        wp_value: str,
+        run_time: datetime | None = None,
+) -> tuple[str, str]:
     """
     Build output folder and full Excel file path for a given WP.
     Returns (cleaned_folder_name, output_file).
+
+    run_time (default: now) supplies the timestamp in the file name, so
+    all outputs of one batch run carry the same timestamp. The path is
+    reserved by creating it exclusively; when another file of the run
+    (or of an earlier run in the same minute) already has that name, a
+    "_2", "_3", ... suffix is added instead of overwriting it. Callers
+    that fail before writing should call release_output_path().
     """
     cleaned_folder_name = sanitize_folder_name(wp_value).replace(" ", "_")
     output_folder = os.path.join(DATA_FOLDER, cleaned_folder_name)
     os.makedirs(output_folder, exist_ok=True)
 
-    current_time = datetime.now().strftime("%I%p%M_%d_%m_%y").lower()
-    output_file = os.path.join(
-        output_folder,
-        f"WP_{cleaned_folder_name}_{current_time}.xlsx",
+    current_time = (run_time or datetime.now()).strftime("%I%p%M_%d_%m_%y").lower()
+    stem = os.path.join(output_folder, f"WP_{cleaned_folder_name}_{current_time}")
+    output_file = f"{stem}.xlsx"
+    suffix = 1
+    while True:
+        try:
+            # Atomic, so parallel workers never get the same path
+            with open(output_file, "x"):
+                pass
+            return cleaned_folder_name, output_file
+        except FileExistsError:
+            suffix += 1
+            output_file = f"{stem}_{suffix}.xlsx"
+
+
+def release_output_path(output_file: str | None) -> None:
+    """Remove a path reserved by build_output_path() if nothing was written."""
+    if not output_file:
+        return
+    try:
+        if os.path.getsize(output_file) == 0:
+            os.remove(output_file)
+    except OSError:
+        pass
+
+
+# Rows converted to plain Python values at a time by _sheet_rows()
+_SHEET_ROW_BLOCK = 10_000
+
+
+def _sheet_rows(df: pd.DataFrame):
+    """
+    Yield the rows of df as plain tuples, with missing values as None.
+
+    Rows are converted one fixed-size block at a time, so only a block
+    (not the whole sheet) is ever held as Python objects.
+    """
+    for start in range(0, len(df), _SHEET_ROW_BLOCK):
+        block = df.iloc[start:start + _SHEET_ROW_BLOCK]
+        values = block.astype(object).where(block.notna(), None)
+        yield from values.itertuples(index=False, name=None)
+
+
+def _write_sheets_xlsxwriter(output_file: str, sheets: dict[str, pd.DataFrame]) -> None:
+    """
+    Stream sheets to disk with xlsxwriter in constant_memory mode: each row
+    is flushed once written, so memory stays flat whatever the row count.
+
+    URL-like text is written as plain strings, as with openpyxl. Every
+    cell's return code is checked: write_row() would stop at the first
+    failing cell and silently leave the rest of the row empty.
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(
+        output_file,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            "strings_to_urls": False,
+        },
+    )
+    # Same header look as DataFrame.to_excel
+    header_format = workbook.add_format(
+        {"bold": True, "border": 1, "align": "center", "valign": "top"}
     )
-    return cleaned_folder_name, output_file
+    try:
+        for sheet_name, df in sheets.items():
+            sheet = workbook.add_worksheet(sheet_name)
+            truncated = 0
+            for row_idx, row in enumerate(
+                    chain([[str(c) for c in df.columns]], _sheet_rows(df))
+            ):
+                cell_format = header_format if row_idx == 0 else None
+                for col_idx, value in enumerate(row):
+                    error = sheet.write(row_idx, col_idx, value, cell_format)
+                    if error == -2:
+                        # Text over Excel's 32,767-character cell limit
+                        truncated += 1
+                    elif error:
+                        raise ValueError(
+                            f"Could not write sheet '{sheet_name}' "
+                            f"row {row_idx + 1}, column {col_idx + 1} "
+                            f"(xlsxwriter error {error})"
+                        )
+            if truncated:
+                print(f"   ⚠️ {sheet_name}: {truncated} cell(s) truncated "
+                      f"to Excel's 32,767-character limit")
+            sheet.autofilter(0, 0, len(df), max(len(df.columns), 1) - 1)
+    finally:
+        workbook.close()
+
+
+def _write_sheets_openpyxl(output_file: str, sheets: dict[str, pd.DataFrame]) -> None:
+    """
+    Stream sheets with an openpyxl write-only workbook, which appends rows
+    without building a cell object model for the whole sheet.
+    """
+    workbook = Workbook(write_only=True)
+    # Same header look as DataFrame.to_excel
+    thin = Side(style="thin")
+    header_font = Font(bold=True)
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal="center", vertical="top")
+
+    for sheet_name, df in sheets.items():
+        sheet = workbook.create_sheet(sheet_name)
+        last_col = get_column_letter(max(len(df.columns), 1))
+        sheet.auto_filter.ref = f"A1:{last_col}{len(df) + 1}"
+
+        header = []
+        for column_name in df.columns:
+            cell = WriteOnlyCell(sheet, value=str(column_name))
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header.append(cell)
+        sheet.append(header)
+
+        for row in _sheet_rows(df):
+            sheet.append(row)
+
+    workbook.save(output_file)
 
 
 def write_output_excel(
@@ -228,6 +437,8 @@ def write_output_excel(
     - Main sheet: renamed to "REF/REV" with filtered columns
     - Optional extra_sheets: append additional sheets
       e.g. {"ActionStepControl": asc_df}.
+    - Rows are streamed to disk (xlsxwriter constant_memory when installed,
+      see EXCEL_WRITE_ENGINE; openpyxl write-only mode otherwise).
     """
     # Define the columns we want to keep in the output (in order)
     output_columns = [
@@ -246,38 +457,16 @@ def write_output_excel(
 
     # Filter DataFrame to only include these columns (if they exist)
     available_columns = [col for col in output_columns if col in df.columns]
-    df_filtered = df[available_columns].copy()
-
-    with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-        # --- main sheet renamed to "REF/REV" ---
-        df_filtered.to_excel(writer, index=False, header=True, sheet_name="REF REV")
-
-        workbook = writer.book
-        main_sheet = workbook["REF REV"]
-
-        # Auto filter on main sheet
-        last_row = main_sheet.max_row
-        last_col_letter = main_sheet.cell(
-            row=1,
-            column=main_sheet.max_column,
-        ).column_letter
-        main_sheet.auto_filter.ref = f"A1:{last_col_letter}{last_row}"
-
-        # --- optional extra sheets ---
-        if extra_sheets:
-            for sheet_name, extra_df in extra_sheets.items():
-                extra_df.to_excel(
-                    writer,
-                    index=False,
-                    header=True,
-                    sheet_name=sheet_name,
-                )
-                sheet = workbook[sheet_name]
-                last_row = sheet.max_row
-                last_col_letter = sheet.cell(
-                    row=1,
-                    column=sheet.max_column,
-                ).column_letter
-                sheet.auto_filter.ref = f"A1:{last_col_letter}{last_row}"
+    df_filtered = df.loc[:, available_columns]
+
+    # --- main sheet renamed to "REF/REV", then optional extra sheets ---
+    sheets = {"REF REV": df_filtered}
+    if extra_sheets:
+        sheets.update(extra_sheets)
+
+    if EXCEL_WRITE_ENGINE == "xlsxwriter":
+        _write_sheets_xlsxwriter(output_file, sheets)
+    else:
+        _write_sheets_openpyxl(output_file, sheets)
 
     print(f"   ✓ File saved: {os.path.basename(output_file)}")
\ No newline at end of file
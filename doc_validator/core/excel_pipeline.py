@@ -2,23 +2,25 @@
 # CORRECTED VERSION - Reference extraction moved to correct location
 
 from datetime import datetime, date
+from typing import Callable
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_string_dtype
 
 from doc_validator.tools.reference_document_extractor import (
     add_reference_document_with_validation
 )
 
-from doc_validator.validation.engine import check_ref_keywords
+from doc_validator.validation.engine import check_ref_keywords_vec
 from doc_validator.config import (
     ACTION_STEP_CONTROL_ENABLED_DEFAULT,
     ACTION_STEP_SHEET_NAME,
     ACTION_STEP_SUMMARY_ENABLED_DEFAULT,
     ACTION_STEP_SUMMARY_SHEET_NAME,
 )
-from doc_validator.tools.action_step_control import compute_action_step_control_df
 from doc_validator.validation.helpers import (
-    contains_header_skip_keyword,
+    header_skip_keyword_mask,
     is_seq_auto_valid,
 )
 from .excel_io import (
@@ -26,10 +28,27 @@ from .excel_io import (
     save_debug_input_output,
     append_to_logbook,
     build_output_path,
+    release_output_path,
     write_output_excel,
     sanitize_folder_name,
 )
 
+# Copy-on-Write makes DataFrame snapshots free: columns are only copied
+# when one side writes to them. Always on from pandas 3.0; on 2.x it is
+# switched on only while process_excel() runs (see there), so importing
+# this module does not change pandas behaviour for the rest of the app.
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+COPY_ON_WRITE = _PANDAS_MAJOR >= 2
+_COPY_ON_WRITE_OPT_IN = _PANDAS_MAJOR == 2
+
+
+def _column_lookup(df: pd.DataFrame) -> dict[str, object]:
+    """Map each upper-cased column name to the first column with that name."""
+    lookup = {}
+    for col in df.columns:
+        lookup.setdefault(str(col).upper(), col)
+    return lookup
+
 
 def get_unique_workpacks(df: pd.DataFrame) -> list[str]:
     """
@@ -41,11 +60,7 @@ def get_unique_workpacks(df: pd.DataFrame) -> list[str]:
     Returns:
         List of unique WP values (excluding empty/invalid)
     """
-    wp_col = None
-    for col in df.columns:
-        if str(col).upper() == "WP":
-            wp_col = col
-            break
+    wp_col = _column_lookup(df).get("WP")
 
     if wp_col is None:
         return []
@@ -74,11 +89,7 @@ def split_dataframe_by_wp(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
         Dictionary mapping WP value to DataFrame
         Example: {"A873-060126-CHK-A05": df1, "A864-050426-CHK-A09": df2}
     """
-    wp_col = None
-    for col in df.columns:
-        if str(col).upper() == "WP":
-            wp_col = col
-            break
+    wp_col = _column_lookup(df).get("WP")
 
     if wp_col is None:
         print("   ⚠️ No WP column found, cannot split")
@@ -111,6 +122,12 @@ def run_action_step_control_hook(
         return None
 
     try:
+        # Imported here so runs (and worker processes) with ASC disabled
+        # never load the ASC module
+        from doc_validator.tools.action_step_control import (
+            compute_action_step_control_df,
+        )
+
         asc_df, summary_df, asc_wp = compute_action_step_control_df(df)
 
         extra_sheets: dict[str, pd.DataFrame] = {
@@ -132,6 +149,26 @@ def run_action_step_control_hook(
         return None
 
 
+def _count_empty_rows(df: pd.DataFrame) -> int:
+    """
+    Count rows whose cells are all blank after str() + strip().
+
+    Works column by column on whole arrays and stops as soon as no
+    candidate rows are left (usually after the first column).
+    """
+    if df.empty:
+        return 0
+
+    empty = np.ones(len(df), dtype=bool)
+    for col in range(df.shape[1]):
+        column = df.iloc[:, col].astype(str).str.strip()
+        empty &= column.eq("").to_numpy(dtype=bool)
+        if not empty.any():
+            return 0
+
+    return int(empty.sum())
+
+
 def validate_dataframe(df: pd.DataFrame) -> tuple[bool, str | None]:
     """
     Validate DataFrame before processing.
@@ -158,31 +195,48 @@ def extract_wp_value(df: pd.DataFrame) -> str:
     Safely extract work package value from DataFrame.
     Looks for 'WP' column (case-insensitive).
     """
-    wp_col = None
-    for col in df.columns:
-        if str(col).upper() == "WP":
-            wp_col = col
-            break
+    wp_col = _column_lookup(df).get("WP")
 
     if wp_col is None:
         print("   ⚠️ No 'WP' column found in Excel file")
         return "No_wp_found"
 
-    wp_series = df[wp_col].dropna()
-    if wp_series.empty:
+    # First non-missing value; stops at the first hit instead of
+    # materialising a dropna() copy of the whole column
+    for value in df[wp_col]:
+        if not pd.isna(value):
+            break
+    else:
         return "No_wp_found"
 
-    wp_value = str(wp_series.iloc[0]).strip()
+    wp_value = str(value).strip()
     if not wp_value or wp_value.upper() in ["N/A", "NA", "NONE", ""]:
         return "No_wp_found"
 
     return wp_value
 
 
+def _parse_iso_date(value) -> pd.Timestamp | None:
+    """Parse a single YYYY-MM-DD value; None if missing or malformed."""
+    try:
+        return pd.Timestamp(datetime.strptime(str(value), "%Y-%m-%d"))
+    except ValueError:
+        return None
+
+
+def _date_span(dates: np.ndarray) -> tuple[date, date]:
+    """Earliest and latest day of a non-empty datetime64 array without NaT."""
+    return (
+        pd.Timestamp(dates.min()).date(),
+        pd.Timestamp(dates.max()).date(),
+    )
+
+
 def apply_date_filter(
         df: pd.DataFrame,
         filter_start_date: date | None = None,
         filter_end_date: date | None = None,
+        log: Callable[[str], None] | None = None,
 ) -> pd.DataFrame:
     """
     Apply date filtering to DataFrame based on action_date column.
@@ -191,221 +245,260 @@ def apply_date_filter(
         df: Input DataFrame
         filter_start_date: Optional start date (inclusive)
         filter_end_date: Optional end date (inclusive)
+        log: Optional function receiving each report line. By default the
+             lines are collected and printed with a single write.
 
     Returns:
         Filtered DataFrame
     """
+    if log is not None:
+        return _apply_date_filter(df, filter_start_date, filter_end_date, log)
+
+    lines: list[str] = []
+    try:
+        return _apply_date_filter(
+            df, filter_start_date, filter_end_date, lines.append
+        )
+    finally:
+        if lines:
+            print("\n".join(lines))
+
+
+def _apply_date_filter(
+        df: pd.DataFrame,
+        filter_start_date: date | None,
+        filter_end_date: date | None,
+        log: Callable[[str], None],
+) -> pd.DataFrame:
+    """Body of apply_date_filter(); report lines go to log."""
     if df.empty:
         return df
 
     # Find date columns (case-insensitive)
-    action_date_col = None
-    start_date_col = None
-    end_date_col = None
-
-    for col in df.columns:
-        col_upper = str(col).upper()
-        if col_upper == "ACTION_DATE":
-            action_date_col = col
-        elif col_upper == "START_DATE":
-            start_date_col = col
-        elif col_upper == "END_DATE":
-            end_date_col = col
+    columns = _column_lookup(df)
+    action_date_col = columns.get("ACTION_DATE")
+    start_date_col = columns.get("START_DATE")
+    end_date_col = columns.get("END_DATE")
 
     if not action_date_col:
-        print("   ⚠️ No action_date column found, skipping date filter")
+        log("   ⚠️ No action_date column found, skipping date filter")
         return df
 
     original_rows = len(df)
 
-    # Convert action_date to datetime with hard-coded format YYYY-MM-DD
-    df[action_date_col] = pd.to_datetime(
+    # Parse action_date (hard-coded format YYYY-MM-DD) into a separate
+    # Series used for filtering; only the kept rows are written back as
+    # normalized YYYY-MM-DD text at the end
+    action_dates = pd.to_datetime(
         df[action_date_col],
         format='%Y-%m-%d',
         errors='coerce'
     )
 
+    # All filters below narrow one boolean mask; the frame itself is
+    # sliced only once, at the end
+    dates = action_dates.to_numpy()  # datetime64, NaT where unparseable
+    keep = ~np.isnat(dates)
+    kept_rows = np.count_nonzero(keep)
+
     # Show action_date range before filtering
-    valid_dates = df[action_date_col].dropna()
-    if not valid_dates.empty:
-        print(f"   📊 ACTION_DATE range (before filter):")
-        print(f"      Min: {valid_dates.min().date()}")
-        print(f"      Max: {valid_dates.max().date()}")
+    if kept_rows:
+        first, last = _date_span(dates[keep])
+        log(f"   📊 ACTION_DATE range (before filter):")
+        log(f"      Min: {first}")
+        log(f"      Max: {last}")
+
+    def _narrow(condition):
+        """AND condition into keep; return how many rows it removed."""
+        nonlocal kept_rows
+        np.logical_and(keep, condition.to_numpy(dtype=bool), out=keep)
+        before, kept_rows = kept_rows, np.count_nonzero(keep)
+        return before - kept_rows
 
     # Remove rows with invalid dates
-    invalid_dates = df[action_date_col].isna().sum()
+    invalid_dates = original_rows - kept_rows
     if invalid_dates > 0:
-        print(f"   ⚠️ Found {invalid_dates} rows with invalid date format - removing them")
-        df = df[df[action_date_col].notna()]
+        log(f"   ⚠️ Found {invalid_dates} rows with invalid date format - removing them")
 
-    if df.empty:
-        print("   ⚠️ All rows have invalid dates")
-        return df
+    if kept_rows == 0:
+        log("   ⚠️ All rows have invalid dates")
+        return df[keep]
 
     # Get file's date range from start_date/end_date columns (FIRST ROW ONLY)
     file_start_date = None
     file_end_date = None
 
+    first_row = np.flatnonzero(keep)[0]
+
     if start_date_col:
-        raw_start = df[start_date_col].iloc[0]
-        start_ts = pd.to_datetime(
-            raw_start,
-            format='%Y-%m-%d',
-            errors='coerce',
-        )
-        if not pd.isna(start_ts):
-            file_start_date = start_ts
+        file_start_date = _parse_iso_date(df[start_date_col].iloc[first_row])
 
     if end_date_col:
-        raw_end = df[end_date_col].iloc[0]
-        end_ts = pd.to_datetime(
-            raw_end,
-            format='%Y-%m-%d',
-            errors='coerce',
-        )
-        if not pd.isna(end_ts):
-            file_end_date = end_ts
+        file_end_date = _parse_iso_date(df[end_date_col].iloc[first_row])
 
     # Show file's date range
-    print(f"\n   📅 FILE DATE RANGE (from columns):")
-    if file_start_date and not pd.isna(file_start_date):
-        print(f"      start_date: {file_start_date.date()}")
+    log(f"\n   📅 FILE DATE RANGE (from columns):")
+    if file_start_date is not None:
+        log(f"      start_date: {file_start_date.date()}")
     else:
-        print(f"      start_date: NOT FOUND")
+        log(f"      start_date: NOT FOUND")
 
-    if file_end_date and not pd.isna(file_end_date):
-        print(f"      end_date: {file_end_date.date()}")
+    if file_end_date is not None:
+        log(f"      end_date: {file_end_date.date()}")
     else:
-        print(f"      end_date: NOT FOUND")
+        log(f"      end_date: NOT FOUND")
 
     # PART 1: Auto-filter by file's date range
-    print(f"\n   🔍 PART 1: Auto-filtering by file's date range...")
+    log(f"\n   🔍 PART 1: Auto-filtering by file's date range...")
 
-    if file_start_date and not pd.isna(file_start_date):
-        before = len(df)
-        df = df[df[action_date_col] >= file_start_date]
-        removed = before - len(df)
+    if file_start_date is not None:
+        removed = _narrow(action_dates >= file_start_date)
         if removed > 0:
-            print(f"      ✓ Removed {removed} rows before {file_start_date.date()}")
+            log(f"      ✓ Removed {removed} rows before {file_start_date.date()}")
         else:
-            print(f"      ℹ️ No rows removed (all >= {file_start_date.date()})")
+            log(f"      ℹ️ No rows removed (all >= {file_start_date.date()})")
 
-    if file_end_date and not pd.isna(file_end_date):
-        before = len(df)
-        df = df[df[action_date_col] <= file_end_date]
-        removed = before - len(df)
+    if file_end_date is not None:
+        removed = _narrow(action_dates <= file_end_date)
         if removed > 0:
-            print(f"      ✓ Removed {removed} rows after {file_end_date.date()}")
+            log(f"      ✓ Removed {removed} rows after {file_end_date.date()}")
         else:
-            print(f"      ℹ️ No rows removed (all <= {file_end_date.date()})")
+            log(f"      ℹ️ No rows removed (all <= {file_end_date.date()})")
 
     # PART 2: User-specified filter
     if filter_start_date or filter_end_date:
-        print(f"\n   👤 USER-SPECIFIED DATE FILTER:")
+        log(f"\n   👤 USER-SPECIFIED DATE FILTER:")
         if filter_start_date:
-            print(f"      From: {filter_start_date}")
+            log(f"      From: {filter_start_date}")
         if filter_end_date:
-            print(f"      To: {filter_end_date}")
+            log(f"      To: {filter_end_date}")
 
-        print(f"\n   🔍 PART 2: Applying user filter...")
+        log(f"\n   🔍 PART 2: Applying user filter...")
 
         if filter_start_date:
-            before = len(df)
-            df = df[df[action_date_col] >= pd.Timestamp(filter_start_date)]
-            removed = before - len(df)
+            removed = _narrow(action_dates >= pd.Timestamp(filter_start_date))
             if removed > 0:
-                print(f"      ✓ Removed {removed} rows before {filter_start_date}")
+                log(f"      ✓ Removed {removed} rows before {filter_start_date}")
             else:
-                print(f"      ℹ️ No rows removed by start date filter")
+                log(f"      ℹ️ No rows removed by start date filter")
 
         if filter_end_date:
-            before = len(df)
-            df = df[df[action_date_col] <= pd.Timestamp(filter_end_date)]
-            removed = before - len(df)
+            removed = _narrow(action_dates <= pd.Timestamp(filter_end_date))
             if removed > 0:
-                print(f"      ✓ Removed {removed} rows after {filter_end_date}")
+                log(f"      ✓ Removed {removed} rows after {filter_end_date}")
             else:
-                print(f"      ℹ️ No rows removed by end date filter")
+                log(f"      ℹ️ No rows removed by end date filter")
 
-    # Show final action_date range
-    valid_dates_after = df[action_date_col].dropna()
-    if not valid_dates_after.empty:
-        print(f"\n   📊 ACTION_DATE range (after filter):")
-        print(f"      Min: {valid_dates_after.min().date()}")
-        print(f"      Max: {valid_dates_after.max().date()}")
+    # Slice once, then normalize the kept dates (e.g. 2024-1-5 -> 2024-01-05)
+    df = df[keep].assign(
+        **{action_date_col: action_dates[keep].dt.strftime('%Y-%m-%d')}
+    )
 
-    filtered_rows = len(df)
+    # Show final action_date range
+    if kept_rows:
+        first, last = _date_span(dates[keep])
+        log(f"\n   📊 ACTION_DATE range (after filter):")
+        log(f"      Min: {first}")
+        log(f"      Max: {last}")
+
+    # kept_rows already tracks the row count of the sliced frame
+    filtered_rows = kept_rows
     total_removed = original_rows - filtered_rows
 
     if total_removed > 0:
-        print(f"\n   ✅ Date filter complete: {filtered_rows} rows remain ({total_removed} removed)")
+        log(f"\n   ✅ Date filter complete: {filtered_rows} rows remain ({total_removed} removed)")
     else:
-        print(f"\n   ✅ No rows filtered (all within range)")
-
-    # Convert back to string format
-    df[action_date_col] = df[action_date_col].dt.strftime('%Y-%m-%d')
+        log(f"\n   ✅ No rows filtered (all within range)")
 
     return df
 
 
 def _prepare_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Rename/create wo_text_action.text, SEQ, header columns as in original code."""
+    columns = _column_lookup(df)
+    renames = {}
+
+    def _first_containing(fragment):
+        return next((c for c in df.columns if fragment in str(c).lower()), None)
+
+    # Resolve every rename first and apply them with a single df.rename
     # wo_text_action.text
+    text_col = None
     if "wo_text_action.text" not in df.columns:
-        candidates = [
-            c for c in df.columns if "wo_text_action.text" in str(c).lower()
-        ]
-        if candidates:
-            df = df.rename(columns={candidates[0]: "wo_text_action.text"})
-            print(f"   ✓ Renamed '{candidates[0]}' to 'wo_text_action.text'")
-        else:
-            df["wo_text_action.text"] = "N/A"
-            print("   ⚠️ No wo_text_action.text column found, created empty column")
-
-    df["wo_text_action.text"] = df["wo_text_action.text"].fillna("N/A").astype(str)
+        text_col = _first_containing("wo_text_action.text")
+        if text_col is not None:
+            renames[text_col] = "wo_text_action.text"
 
     # SEQ
+    seq_col = None
     if "SEQ" not in df.columns:
-        seq_candidates = [c for c in df.columns if str(c).upper() == "SEQ"]
-        if seq_candidates:
-            df = df.rename(columns={seq_candidates[0]: "SEQ"})
-            print(f"   ✓ Found SEQ column: '{seq_candidates[0]}'")
-        else:
-            df["SEQ"] = None
-            print("   ⚠️ No SEQ column found, validation will proceed normally")
+        seq_col = columns.get("SEQ")
+        if seq_col is not None:
+            renames[seq_col] = "SEQ"
+
+    # HEADER
+    header_col = None
+    if "wo_text_action.header" not in df.columns:
+        header_col = _first_containing("wo_text_action.header")
+        if header_col is not None:
+            renames[header_col] = "wo_text_action.header"
+
+    # DES
+    des_col = None
+    if "DES" not in df.columns:
+        des_col = columns.get("DES")
+        if des_col is not None:
+            renames[des_col] = "DES"
+
+    if renames:
+        df = df.rename(columns=renames)
+
+    # wo_text_action.text
+    if text_col is not None:
+        print(f"   ✓ Renamed '{text_col}' to 'wo_text_action.text'")
+    elif "wo_text_action.text" not in df.columns:
+        df["wo_text_action.text"] = "N/A"
+        print("   ⚠️ No wo_text_action.text column found, created empty column")
+
+    # Input is read as strings, so normally only missing values need
+    # filling; converting again would copy every value for nothing.
+    text = df["wo_text_action.text"]
+    if is_string_dtype(text.dtype):
+        df["wo_text_action.text"] = text.fillna("N/A")
+    else:
+        df["wo_text_action.text"] = text.fillna("N/A").astype(str)
+
+    # SEQ
+    if seq_col is not None:
+        print(f"   ✓ Found SEQ column: '{seq_col}'")
+    elif "SEQ" not in df.columns:
+        df["SEQ"] = None
+        print("   ⚠️ No SEQ column found, validation will proceed normally")
 
     df["SEQ"] = df["SEQ"].fillna("")
 
     # HEADER
-    if "wo_text_action.header" not in df.columns:
-        header_candidates = [
-            c for c in df.columns if "wo_text_action.header" in str(c).lower()
-        ]
-        if header_candidates:
-            df = df.rename(columns={header_candidates[0]: "wo_text_action.header"})
-            print(f"   ✓ Found header column: '{header_candidates[0]}'")
-        else:
-            df["wo_text_action.header"] = None
-            print(
-                "   ⚠️ No wo_text_action.header column found, "
-                "validation will proceed normally"
-            )
+    if header_col is not None:
+        print(f"   ✓ Found header column: '{header_col}'")
+    elif "wo_text_action.header" not in df.columns:
+        df["wo_text_action.header"] = None
+        print(
+            "   ⚠️ No wo_text_action.header column found, "
+            "validation will proceed normally"
+        )
 
     df["wo_text_action.header"] = df["wo_text_action.header"].fillna("")
 
     # DES
-    if "DES" not in df.columns:
-        des_candidates = [c for c in df.columns if str(c).upper() == "DES"]
-        if des_candidates:
-            df = df.rename(columns={des_candidates[0]: "DES"})
-            print(f"   ✓ Found DES column: '{des_candidates[0]}'")
-        else:
-            df["DES"] = None
-            print(
-                "   ⚠️ No DES column found, "
-                "DES-based reference logic will treat rows "
-                "as if no DES reference is present"
-            )
+    if des_col is not None:
+        print(f"   ✓ Found DES column: '{des_col}'")
+    elif "DES" not in df.columns:
+        df["DES"] = None
+        print(
+            "   ⚠️ No DES column found, "
+            "DES-based reference logic will treat rows "
+            "as if no DES reference is present"
+        )
 
     df["DES"] = df["DES"].fillna("")
 
@@ -417,6 +510,7 @@ def process_combined_excel(
         filter_start_date=None,
         filter_end_date=None,
         enable_action_step_control: bool = ACTION_STEP_CONTROL_ENABLED_DEFAULT,
+        run_time: datetime | None = None,
 ) -> list[str]:
     """
     Process a combined Excel file containing multiple workpacks.
@@ -429,6 +523,8 @@ def process_combined_excel(
         filter_start_date: Optional start date for filtering
         filter_end_date: Optional end date for filtering
         enable_action_step_control: Enable Action Step Control sheet
+        run_time: Batch timestamp for output names and the logbook
+                  (defaults to the start of this call)
 
     Returns:
         List of output file paths (one per workpack)
@@ -438,6 +534,7 @@ def process_combined_excel(
     print("=" * 60)
 
     overall_start = datetime.now()
+    run_time = run_time or overall_start
     output_files = []
 
     try:
@@ -458,7 +555,8 @@ def process_combined_excel(
                 file_path,
                 filter_start_date,
                 filter_end_date,
-                enable_action_step_control
+                enable_action_step_control,
+                run_time=run_time,
             )
             return [output_file] if output_file else []
 
@@ -469,7 +567,8 @@ def process_combined_excel(
                 file_path,
                 filter_start_date,
                 filter_end_date,
-                enable_action_step_control
+                enable_action_step_control,
+                run_time=run_time,
             )
             return [output_file] if output_file else []
 
@@ -515,7 +614,8 @@ def process_combined_excel(
                     temp_path,
                     filter_start_date,
                     filter_end_date,
-                    enable_action_step_control
+                    enable_action_step_control,
+                    run_time=run_time,
                 )
 
                 if output_file:
@@ -563,6 +663,7 @@ def process_excel(
         filter_start_date=None,
         filter_end_date=None,
         enable_action_step_control: bool = ACTION_STEP_CONTROL_ENABLED_DEFAULT,
+        run_time: datetime | None = None,
 ) -> str | None:
     """
     Process Excel file with multi-state validation and optional date filtering.
@@ -572,27 +673,52 @@ def process_excel(
         filter_start_date: Optional start date for filtering
         filter_end_date: Optional end date for filtering
         enable_action_step_control: Enable Action Step Control sheet
+        run_time: Batch timestamp for the output name and the logbook
+                  (defaults to now)
 
     Returns:
         Output Excel file path or None on error.
     """
+    args = (
+        file_path,
+        filter_start_date,
+        filter_end_date,
+        enable_action_step_control,
+        run_time,
+    )
+    if not _COPY_ON_WRITE_OPT_IN:
+        return _process_excel(*args)
+
+    # pandas options are process-wide, so this is scoped in time only
+    with pd.option_context("mode.copy_on_write", True):
+        return _process_excel(*args)
+
+
+def _process_excel(
+        file_path: str,
+        filter_start_date,
+        filter_end_date,
+        enable_action_step_control: bool,
+        run_time: datetime | None,
+) -> str | None:
+    """Body of process_excel(), run with Copy-on-Write enabled."""
     print("\n" + "=" * 60)
     print("PROCESSING EXCEL FILE")
     print("=" * 60)
 
     start_time = datetime.now()
+    output_file = None
 
     try:
         # ========== STEP 1: Read Excel File ==========
         print(f"\n1. Reading file: {file_path}")
         df = read_input_excel(file_path)
+        df_input = df  # kept for the row-loss debug dump
         print(f"   ✓ Read {df.shape[0]} rows, {df.shape[1]} columns")
 
-        empty_rows = df[
-            df.apply(lambda x: x.astype(str).str.strip().eq("").all(), axis=1)
-        ]
-        if not empty_rows.empty:
-            print(f"   ⚠️ Found {len(empty_rows)} completely empty rows")
+        empty_row_count = _count_empty_rows(df)
+        if empty_row_count:
+            print(f"   ⚠️ Found {empty_row_count} completely empty rows")
 
         # ========== STEP 2: Apply Date Filter (always) ==========
         step_num = 2
@@ -606,7 +732,8 @@ def process_excel(
         )
 
         # Snapshot for Action Step Control BEFORE validation mutates df
-        df_for_action_step_control = df.copy()
+        # (a lazy copy under Copy-on-Write)
+        df_for_action_step_control = df.copy(deep=not COPY_ON_WRITE)
 
         if df.empty:
             print("   ✗ No data remains after date filtering")
@@ -638,14 +765,11 @@ def process_excel(
             "OPEN/CLOSE ACCESS, GENERAL will be marked as Valid"
         )
 
-        df["Reason"] = df.apply(
-            lambda row: check_ref_keywords(
-                row["wo_text_action.text"],
-                row["SEQ"],
-                row["wo_text_action.header"],
-                row["DES"],
-            ),
-            axis=1,
+        df["Reason"] = check_ref_keywords_vec(
+            df["wo_text_action.text"],
+            df["SEQ"],
+            df["wo_text_action.header"],
+            df["DES"],
         )
 
         print("   ✓ Validation complete")
@@ -674,14 +798,16 @@ def process_excel(
         step_num += 1
 
         # ========== STEP 6: Statistics ==========
+        # One pass over Reason for all category counts
+        reason_counts = df["Reason"].value_counts()
         counts = {
             "orig_rows": orig_rows,
             "out_rows": int(df.shape[0]),
-            "Missing reference": int((df["Reason"] == "Missing reference").sum()),
-            "Valid": int((df["Reason"] == "Valid").sum()),
-            "N/A": int((df["Reason"] == "N/A").sum()),
+            "Missing reference": int(reason_counts.get("Missing reference", 0)),
+            "Valid": int(reason_counts.get("Valid", 0)),
+            "N/A": int(reason_counts.get("N/A", 0)),
             "header_auto_valid": int(
-                df["wo_text_action.header"].apply(contains_header_skip_keyword).sum()
+                header_skip_keyword_mask(df["wo_text_action.header"]).sum()
             )
         }
 
@@ -693,7 +819,7 @@ def process_excel(
             )
 
         # SEQ auto-valid count
-        counts["seq_auto_valid"] = int(df["SEQ"].apply(is_seq_auto_valid).sum())
+        counts["seq_auto_valid"] = int(df["SEQ"].map(is_seq_auto_valid).sum())
 
         # Row mismatch check
         if counts["orig_rows"] != counts["out_rows"]:
@@ -704,7 +830,7 @@ def process_excel(
                 f"      LOST ROWS: "
                 f"{counts['orig_rows'] - counts['out_rows']}"
             )
-            save_debug_input_output(file_path, df)
+            save_debug_input_output(file_path, df, df_original=df_input)
 
         # Verify counts
         total_counted = sum(
@@ -748,7 +874,7 @@ def process_excel(
         # ========== STEP 7: Prepare Output ==========
         print(f"\n{step_num}. Preparing output file...")
         wp_value = extract_wp_value(df)
-        cleaned_folder_name, output_file = build_output_path(wp_value)
+        cleaned_folder_name, output_file = build_output_path(wp_value, run_time)
         step_num += 1
 
         # --- Action Step Control hook ---
@@ -777,7 +903,12 @@ def process_excel(
 
         # ========== STEP 9: Logbook ==========
         processing_time = (datetime.now() - start_time).total_seconds()
-        append_to_logbook(cleaned_folder_name, counts, processing_time)
+        append_to_logbook(
+            cleaned_folder_name,
+            counts,
+            processing_time,
+            run_time=run_time,
+        )
 
         # Summary
         print("\n" + "=" * 60)
@@ -793,4 +924,6 @@ def process_excel(
         print(f"\n✗ ERROR: {str(e)}")
         import traceback
         traceback.print_exc()
+        # Don't leave an empty placeholder behind
+        release_output_path(output_file)
         return None
\ No newline at end of file
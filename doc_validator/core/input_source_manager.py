@@ -6,11 +6,18 @@ Manages loading Excel files from different sources:
 - Google Drive folder
 """
 
-from pathlib import Path
+import json
+import os
+import time
+from operator import attrgetter
 from typing import List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from doc_validator.config import INPUT_FOLDER
+from doc_validator.config import (
+    DRIVE_LIST_CACHE_FILE,
+    DRIVE_LIST_CACHE_MAX_AGE,
+    INPUT_FOLDER,
+)
 from doc_validator.core.drive_io import (
     authenticate_drive_api,
     get_all_excel_files_from_folder,
@@ -22,14 +29,21 @@ class FileInfo:
     """Information about an Excel file from any source."""
     name: str
     source_type: str  # "local" or "drive"
-    # For local files
+    # For local files (size/mtime captured once, at discovery)
     local_path: Optional[str] = None
+    size_bytes: Optional[int] = None
+    mtime: Optional[float] = None
     # For Drive files
     file_id: Optional[str] = None
     mime_type: Optional[str] = None
+    # Lowercased name, computed once for case-insensitive search
+    name_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
 
 
-type_of_input_file = ["*.xlsx", "*.xls", "*.XLSX", "*.XLS"]
+EXCEL_EXTENSIONS = (".xlsx", ".xls")
 
 
 def get_local_excel_files(folder_path: str) -> List[FileInfo]:
@@ -42,32 +56,41 @@ def get_local_excel_files(folder_path: str) -> List[FileInfo]:
     Returns:
         List of FileInfo objects for local Excel files
     """
-    folder = Path(folder_path)
-
-    if not folder.exists() or not folder.is_dir():
+    try:
+        entries = os.scandir(folder_path)
+    except OSError:
         return []
 
     excel_files = []
 
-    # Find all Excel files (case-insensitive)
+    # Single directory read; extension match is case-insensitive
     seen = set()
-    for pattern in type_of_input_file:
-        for file_path in folder.glob(pattern):
-            if not file_path.is_file():
+    with entries:
+        for entry in entries:
+            name_lower = entry.name.lower()
+            if not name_lower.endswith(EXCEL_EXTENSIONS):
+                continue
+            if name_lower in seen or not entry.is_file():
                 continue
-            if file_path.resolve() in seen:
+            # DirEntry.stat() is cached (and free on Windows)
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Removed or unreadable since the directory was listed
                 continue
-            seen.add(file_path.resolve())
+            seen.add(name_lower)
             excel_files.append(
                 FileInfo(
-                    name=file_path.name,
+                    name=entry.name,
                     source_type="local",
-                    local_path=str(file_path),
+                    local_path=entry.path,
+                    size_bytes=stat.st_size,
+                    mtime=stat.st_mtime,
                 )
             )
 
     # Sort by name
-    excel_files.sort(key=lambda x: x.name.lower())
+    excel_files.sort(key=attrgetter("name_lower"))
 
     return excel_files
 
@@ -101,6 +124,50 @@ def get_drive_excel_files(api_key: str, folder_id: str) -> List[FileInfo]:
         return []
 
 
+def load_cached_drive_files(folder_id: str) -> Optional[List[FileInfo]]:
+    """
+    Get the cached Drive listing for a folder, if it is recent enough.
+
+    Args:
+        folder_id: Google Drive folder ID
+
+    Returns:
+        List of FileInfo objects, or None if there is no usable cache entry
+    """
+    try:
+        with open(DRIVE_LIST_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["folder_id"] != folder_id:
+            return None
+        if time.time() - cache["ts"] > DRIVE_LIST_CACHE_MAX_AGE:
+            return None
+        return [
+            FileInfo(
+                name=name,
+                source_type="drive",
+                file_id=file_id,
+                mime_type=mime_type,
+            )
+            for name, file_id, mime_type in cache["files"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_drive_files_cache(folder_id: str, files: List[FileInfo]) -> None:
+    """Store a Drive listing for load_cached_drive_files (best effort)."""
+    cache = {
+        "folder_id": folder_id,
+        "ts": time.time(),
+        "files": [[f.name, f.file_id, f.mime_type] for f in files],
+    }
+    try:
+        with open(DRIVE_LIST_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
 def get_default_input_folder() -> str:
     """Get the default INPUT folder path."""
     return INPUT_FOLDER
@@ -7,15 +7,21 @@ High-level processing pipeline that connects:
 This module is the "brain" that both CLI and GUI code will call.
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Callable, List, Dict, Any, Optional
-from datetime import date
+from datetime import date, datetime
 
+from doc_validator.config import DRIVE_DOWNLOAD_MAX_WORKERS, PROCESS_MAX_WORKERS
 from doc_validator.core.drive_io import (
     authenticate_drive_api,
     download_all_excel_files,
     read_credentials_file,
 )
+from doc_validator.core.excel_io import set_logbook_lock
 from doc_validator.core.excel_pipeline import process_excel
+from doc_validator.validation import helpers
+from doc_validator.validation.init_validator import get_rule_manager
 
 
 Logger = Callable[[str], None]
@@ -26,6 +32,16 @@ def _default_logger(message: str) -> None:
     print(message)
 
 
+def _init_process_worker(rule_manager, logbook_lock) -> None:
+    """
+    Pool initializer: give each worker process the parent's rules and
+    the shared logbook lock (spawned processes start with neither).
+    """
+    if rule_manager is not None:
+        helpers.initialize_rules(rule_manager)
+    set_logbook_lock(logbook_lock)
+
+
 def process_work_package(
     api_key: str,
     folder_id: str,
@@ -33,13 +49,17 @@ def process_work_package(
     filter_start_date: Optional[date] = None,
     filter_end_date: Optional[date] = None,
     enable_action_step_control: bool = True,
+    max_download_workers: int = DRIVE_DOWNLOAD_MAX_WORKERS,
+    max_process_workers: int = PROCESS_MAX_WORKERS,
     logger: Optional[Logger] = None,
 ) -> List[Dict[str, Any]]:
     """
     High-level pipeline with optional date filtering.
     - Authenticates to Google Drive
     - Downloads **all Excel files** in the given folder
-    - Runs the Excel validation pipeline on each (with optional date filter)
+    - Runs the Excel validation pipeline on each (with optional date filter),
+      one worker process per file up to max_process_workers, starting
+      each file as soon as its download completes
     - Optionally runs Action Step Control (ASC) and adds its sheet
       to the output workbook.
     - Returns a list of results (one per file)
@@ -50,6 +70,8 @@ def process_work_package(
         filter_start_date: Optional start date for filtering
         filter_end_date: Optional end date for filtering
         enable_action_step_control: If True, generate ASC sheet for each file
+        max_download_workers: Number of files downloaded concurrently
+        max_process_workers: Number of files validated in parallel processes
         logger: Optional logging function (e.g., for GUI). Defaults to print.
 
     Returns:
@@ -78,50 +100,81 @@ def process_work_package(
     drive_service = authenticate_drive_api(api_key)
     log("✓ Authentication successful")
 
-    # 2) Download all Excel files from folder
-    log("Listing and downloading Excel files from folder...")
-    downloaded_files = download_all_excel_files(drive_service, folder_id)
-
-    if not downloaded_files:
-        log("No Excel files were downloaded. Nothing to process.")
-        log("=== PROCESSING FINISHED (NO FILES) ===")
-        return []
-
-    log(f"✓ Downloaded {len(downloaded_files)} file(s).")
-
-    # 3) Process each downloaded Excel file
-    results: List[Dict[str, Any]] = []
-
-    for idx, file_info in enumerate(downloaded_files, start=1):
-        src_name = file_info.get("name")
-        src_id = file_info.get("id")
-        local_path = file_info.get("path")
-
-        log("")
-        log(f"[{idx}/{len(downloaded_files)}] Processing file: {src_name}")
-        log(f"    Local path: {local_path}")
-
-        # Process with optional date filter + ASC flag
-        output_file = process_excel(
-            local_path,
-            filter_start_date=filter_start_date,
-            filter_end_date=filter_end_date,
-            enable_action_step_control=enable_action_step_control,
+    # 2) Download all Excel files from folder and validate them in
+    #    parallel processes. Each file is handed to the pool as soon as its
+    #    download finishes, so processing overlaps the remaining downloads.
+    run_time = datetime.now()  # one timestamp for the whole run
+    output_files: Dict[str, Optional[str]] = {}
+    pending: Dict[Any, Dict[str, Any]] = {}
+
+    # "spawn" because workers start while download threads are running,
+    # and forking a multi-threaded process can deadlock
+    mp_context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(
+        max_workers=max(1, max_process_workers),
+        mp_context=mp_context,
+        initializer=_init_process_worker,
+        initargs=(get_rule_manager(), mp_context.Lock()),
+    ) as executor:
+
+        def _submit(file_info: Dict[str, Any]) -> None:
+            future = executor.submit(
+                process_excel,
+                file_info["path"],
+                filter_start_date=filter_start_date,
+                filter_end_date=filter_end_date,
+                enable_action_step_control=enable_action_step_control,
+                run_time=run_time,
+            )
+            pending[future] = file_info
+
+        log("Listing and downloading Excel files from folder...")
+        downloaded_files = download_all_excel_files(
+            drive_service,
+            folder_id,
+            max_workers=max_download_workers,
+            on_downloaded=_submit,
         )
 
-        if output_file:
-            log(f"    ✓ Output file created: {output_file}")
-        else:
-            log("    ✗ Processing failed for this file")
-
-        results.append(
-            {
-                "source_name": src_name,
-                "source_id": src_id,
-                "local_path": local_path,
-                "output_file": output_file,
-            }
-        )
+        if not downloaded_files:
+            log("No Excel files were downloaded. Nothing to process.")
+            log("=== PROCESSING FINISHED (NO FILES) ===")
+            return []
+
+        total = len(downloaded_files)
+        log(f"✓ Downloaded {total} file(s).")
+
+        # 3) Collect the per-file results as the workers finish
+        for done, future in enumerate(as_completed(pending), start=1):
+            file_info = pending[future]
+
+            log("")
+            log(f"[{done}/{total}] Finished file: {file_info['name']}")
+            log(f"    Local path: {file_info['path']}")
+
+            try:
+                output_file = future.result()
+            except Exception as e:
+                log(f"    ✗ Error: {e}")
+                output_file = None
+
+            output_files[file_info["id"]] = output_file
+            if output_file:
+                log(f"    ✓ Output file created: {output_file}")
+            else:
+                log("    ✗ Processing failed for this file")
+
+    # Results keep the download order, not completion order
+    results: List[Dict[str, Any]] = [
+        {
+            "source_name": file_info["name"],
+            "source_id": file_info["id"],
+            "local_path": file_info["path"],
+            "output_file": output_files.get(file_info["id"]),
+        }
+        for file_info in downloaded_files
+    ]
 
     log("")
     log("=== ALL FILES PROCESSED ===")
@@ -134,6 +187,8 @@ def process_from_credentials_file(
     filter_start_date: Optional[date] = None,
     filter_end_date: Optional[date] = None,
     enable_action_step_control: bool = True,
+    max_download_workers: int = DRIVE_DOWNLOAD_MAX_WORKERS,
+    max_process_workers: int = PROCESS_MAX_WORKERS,
     logger: Optional[Logger] = None,
 ) -> List[Dict[str, Any]]:
     """
@@ -145,6 +200,8 @@ def process_from_credentials_file(
         filter_start_date: Optional start date for filtering
         filter_end_date: Optional end date for filtering
         enable_action_step_control: If True, generate ASC sheet for each file
+        max_download_workers: Number of files downloaded concurrently
+        max_process_workers: Number of files validated in parallel processes
         logger: Optional logger (for CLI/GUI)
 
     Returns:
@@ -167,5 +224,7 @@ def process_from_credentials_file(
         filter_start_date=filter_start_date,
         filter_end_date=filter_end_date,
         enable_action_step_control=enable_action_step_control,
+        max_download_workers=max_download_workers,
+        max_process_workers=max_process_workers,
         logger=logger,
     )
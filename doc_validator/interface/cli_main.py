@@ -10,11 +10,30 @@ Replaces the old top-level `main.py` script. This module:
 
 from __future__ import annotations
 
-import sys
+import argparse
+import multiprocessing
 from typing import List
 
-from doc_validator.config import LINK_FILE
-from doc_validator.core.pipeline import process_from_credentials_file
+from doc_validator.config import LINK_FILE, ensure_folders
+
+
+# Built once at import; main() may be called repeatedly (e.g. from tests)
+_PARSER = argparse.ArgumentParser(
+    prog="doc_validator",
+    description="Documentation Validator - batch mode",
+)
+_PARSER.add_argument(
+    "credentials",
+    nargs="?",
+    default=None,
+    help="credentials file with GG_API_KEY / GG_FOLDER_ID (default: LINK_FILE)",
+)
+_PARSER.add_argument(
+    "--no-asc",
+    dest="enable_asc",
+    action="store_false",
+    help="disable Action Step Control (ASC) sheet generation",
+)
 
 
 def _cli_logger(message: str) -> None:
@@ -33,44 +52,33 @@ def main(argv: List[str] | None = None) -> int:
         python -m doc_validator.interface.cli_main path/to/credentials.txt --no-asc
         python -m doc_validator.interface.cli_main --no-asc
 
-    If a path is provided as the first argument (excluding --no-asc),
-    it will be used as the credentials file (instead of the default LINK_FILE).
+    If a path is provided, it will be used as the credentials file
+    (instead of the default LINK_FILE).
 
-    The optional flag:
+    The optional flag (accepted anywhere on the command line):
         --no-asc   disables Action Step Control (ASC) sheet generation.
     """
-    if argv is None:
-        argv = sys.argv[1:]
+    args = _PARSER.parse_args(argv)  # argv=None reads sys.argv[1:]
+
+    ensure_folders()
 
     print("=" * 60)
     print("Documentation Validator - BATCH MODE")
     print("=" * 60 + "\n")
 
-    # Defaults
-    enable_asc = True
-    credentials_path = LINK_FILE
-
-    # Very simple argument parsing:
-    #   []                         -> default LINK_FILE, ASC enabled
-    #   [creds]                    -> creds, ASC enabled
-    #   [--no-asc]                 -> default LINK_FILE, ASC disabled
-    #   [creds, --no-asc]          -> creds, ASC disabled
-    if argv:
-        # Check for --no-asc as the last argument
-        if argv[-1] == "--no-asc":
-            enable_asc = False
-            argv = argv[:-1]
-
-        if argv:
-            # First remaining arg is the credentials path
-            credentials_path = argv[0]
-            print(f"Using credentials file from CLI argument: {credentials_path}")
-        else:
-            # No credentials path left after stripping --no-asc
-            print(f"Using default credentials file from config: {credentials_path}")
+    enable_asc = args.enable_asc
+
+    if args.credentials:
+        credentials_path = args.credentials
+        print(f"Using credentials file from CLI argument: {credentials_path}")
     else:
+        credentials_path = LINK_FILE
         print(f"Using default credentials file from config: {credentials_path}")
 
+    # Imported only once the arguments are valid: the pipeline pulls in
+    # pandas and the Google API client, which --help does not need
+    from doc_validator.core.pipeline import process_from_credentials_file
+
     try:
         # Run the high-level pipeline
         results = process_from_credentials_file(
@@ -94,31 +102,43 @@ def main(argv: List[str] | None = None) -> int:
         return 0
 
     # Build summary similar to old main.py
-    processed_files = [r for r in results if r.get("output_file")]
-    failed_files = [r for r in results if not r.get("output_file")]
-
-    print("\n" + "=" * 60)
-    print("BATCH PROCESSING COMPLETE")
-    print("=" * 60)
-    print(f"\n📊 Summary:")
-    print(f"   Total files: {len(results)}")
-    print(f"   ✅ Successful: {len(processed_files)}")
-    print(f"   ❌ Failed: {len(failed_files)}")
+    # One pass; keep only the fields the summary prints
+    processed_files, failed_files = [], []
+    for r in results:
+        output_file = r.get("output_file")
+        if output_file:
+            processed_files.append((r["source_name"], output_file))
+        else:
+            failed_files.append(r["source_name"])
+
+    # Collected and printed with a single write
+    lines = [
+        "\n" + "=" * 60,
+        "BATCH PROCESSING COMPLETE",
+        "=" * 60,
+        "\n📊 Summary:",
+        f"   Total files: {len(results)}",
+        f"   ✅ Successful: {len(processed_files)}",
+        f"   ❌ Failed: {len(failed_files)}",
+    ]
 
     if processed_files:
-        print(f"\n✅ Successfully processed files:")
-        for i, r in enumerate(processed_files, 1):
-            print(f"   {i}. {r['source_name']}")
-            print(f"      → {r['output_file']}")
+        lines.append("\n✅ Successfully processed files:")
+        for i, (name, output_file) in enumerate(processed_files, 1):
+            lines.append(f"   {i}. {name}")
+            lines.append(f"      → {output_file}")
 
     if failed_files:
-        print(f"\n❌ Failed files:")
-        for i, r in enumerate(failed_files, 1):
-            print(f"   {i}. {r['source_name']}")
+        lines.append("\n❌ Failed files:")
+        for i, name in enumerate(failed_files, 1):
+            lines.append(f"   {i}. {name}")
 
-    print("\n" + "=" * 60)
+    lines.append("\n" + "=" * 60)
+    print("\n".join(lines))
     return 0
 
 
 if __name__ == "__main__":
+    # Needed by the per-file process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -8,12 +8,12 @@ import os
 import platform
 import subprocess
 import sys
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 from typing import List, Optional
 
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QTextCursor, QColor, QFont, QIcon, QPixmap
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QTextCursor, QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -22,9 +22,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
+    QPlainTextEdit,
     QMessageBox,
     QHeaderView,
     QLineEdit,
@@ -33,17 +32,19 @@ from PyQt6.QtWidgets import (
     QSplitter, QCheckBox,
 )
 
-from doc_validator.config import LINK_FILE
+from doc_validator.config import LINK_FILE, ensure_folders
 from doc_validator.core.drive_io import read_credentials_file
 from doc_validator.core.input_source_manager import (
     FileInfo,
     get_local_excel_files,
-    get_drive_excel_files,
     get_default_input_folder,
+    load_cached_drive_files,
 )
+from doc_validator.interface.models.file_list_model import FileListModel
 from doc_validator.interface.panels.date_filter_panel import DateFilterPanel
 from doc_validator.interface.panels.input_source_panel import InputSourcePanel
 from doc_validator.interface.styles.theme import get_dark_theme_stylesheet
+from doc_validator.interface.workers.drive_enumeration_worker import DriveEnumerationWorker
 from doc_validator.interface.workers.processing_worker import ProcessingWorker
 
 # NEW: Import for updating validation rules
@@ -52,17 +53,26 @@ from doc_validator.validation.init_validator import (
     get_rule_manager,
 )
 
+# Lines kept in the console; older ones are dropped as new ones arrive
+LOG_MAX_LINES = 2000
+
+# Icons, relative to main_window.py (resolved once, at import)
+_ICONS_DIR = Path(__file__).resolve().parent.parent / "resources" / "icons"
+_LOGO_PATH = str(_ICONS_DIR / "app_logo.png")
+_REFRESH_ICON_PATH = str(_ICONS_DIR / "refresh.png")
+
 
 class MainWindow(QMainWindow):
+    # Built on first use and shared by every window
+    _logo_pixmap: Optional[QPixmap] = None
+    _refresh_icon: Optional[QIcon] = None
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self.setWindowTitle("AMOS Documentation Validator")
         self.resize(1200, 800)
 
-        # Apply dark theme
-        self.setStyleSheet(get_dark_theme_stylesheet())
-
         # Credentials / Drive folder info
         self.api_key: Optional[str] = None
         self.folder_id: Optional[str] = None
@@ -78,12 +88,21 @@ class MainWindow(QMainWindow):
         # File source management
         self.all_files: List[FileInfo] = []
         self.filtered_files: List[FileInfo] = []
-        self._status_row_map: dict[str, list[int]] = {}
+        # Parallel to all_files, for the search filter
+        self._names_lower: List[str] = []
+        self._applied_search = ""
+        self._status_file_map: dict[str, list[FileInfo]] = {}
         self.current_source_type: str = "local"
         self.current_local_path: str = get_default_input_folder()
 
         # Worker thread reference
         self.worker: Optional[ProcessingWorker] = None
+        self.drive_worker: Optional[DriveEnumerationWorker] = None
+        # True while the table shows a cached Drive listing being refreshed
+        self._drive_files_cached = False
+
+        # Console text waiting for the next flush (see _append_log)
+        self._log_buffer: List[str] = []
 
         # Build UI
         self._setup_ui()
@@ -94,8 +113,9 @@ class MainWindow(QMainWindow):
         # NEW: Initialize validation engine on startup
         self._initialize_validation_engine()
 
-        # Load files from default source
-        self._load_files_from_current_source()
+        # Load files from default source once the event loop is running,
+        # so the window is shown before the folder is enumerated
+        QTimer.singleShot(0, self._load_files_from_current_source)
 
     def _on_header_clicked(self, index: int) -> None:
         """Handle clicks on table header sections."""
@@ -321,20 +341,17 @@ class MainWindow(QMainWindow):
         # ========== HEADER WITH LOGO ==========
         header_layout = QHBoxLayout()
 
-        # Compute path relative to main_window.py
-        project_root = Path(__file__).resolve().parent.parent
-        logo_path = project_root / "resources" / "icons" / "app_logo.png"
-
         logo_box = QHBoxLayout()
         logo_box.setSpacing(10)
 
         # --- Logo image ---
         logo_image = QLabel()
-        pix = QPixmap(str(logo_path))
-
-        # scale to nice height, keep sharp edges
-        pix = pix.scaledToHeight(32, Qt.TransformationMode.SmoothTransformation)
-        logo_image.setPixmap(pix)
+        if MainWindow._logo_pixmap is None:
+            # scale to nice height, keep sharp edges (once per process)
+            MainWindow._logo_pixmap = QPixmap(_LOGO_PATH).scaledToHeight(
+                32, Qt.TransformationMode.SmoothTransformation
+            )
+        logo_image.setPixmap(MainWindow._logo_pixmap)
 
         # --- App title ---
         logo_text = QLabel("AMOS Document Validators")
@@ -377,9 +394,7 @@ class MainWindow(QMainWindow):
         self.input_panel.open_output_clicked.connect(self._open_output_folder)
         # expose inner widgets so existing methods keep working
         self.combo_source = self.input_panel.combo_source
-        self.label_folder_path = self.input_panel.label_folder_path
         self.btn_browse_folder = self.input_panel.btn_browse_folder
-        self.label_drive_info = self.input_panel.label_drive_info
 
         self.combo_source.currentIndexChanged.connect(self._on_source_changed)
         self.btn_browse_folder.clicked.connect(self._browse_local_folder)
@@ -490,6 +505,12 @@ class MainWindow(QMainWindow):
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Type to filter files by name...")
         self.search_bar.textChanged.connect(self._on_search_changed)
+
+        # Filtering runs once typing pauses, not on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search_filter)
         self.search_bar.setClearButtonEnabled(True)
         self.search_bar.setStyleSheet("""
             QLineEdit {
@@ -509,11 +530,10 @@ class MainWindow(QMainWindow):
         right_layout.addLayout(header_row)
 
         # ========== FILE LIST TABLE ==========
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "", "File Name", "Source", "Size", "Modified", "Status"
-        ])
+        # View + model: repopulating is one model reset, not an item per cell
+        self.file_model = FileListModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.file_model)
 
         # Column sizes
         header = self.table.horizontalHeader()
@@ -523,46 +543,49 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         header.resizeSection(0, refresh_size + 4)
 
-        # Other columns
+        # Other columns. Source/Size/Modified/Status have bounded content,
+        # so fixed widths spare Qt a text-measuring pass on every reset.
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # File Name
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Source
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Size
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Modified
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Status
+        for column, width in (
+                (FileListModel.COL_SOURCE, 100),
+                (FileListModel.COL_SIZE, 90),
+                (FileListModel.COL_MODIFIED, 140),
+                (FileListModel.COL_STATUS, 100),
+        ):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
 
         # Make header sections tight so the icon fills the cell
         header.setMinimumHeight(refresh_size + 4)
 
         # ---------- big refresh icon in first header cell ----------
-        refresh_item = QTableWidgetItem()
-        project_root = Path(__file__).resolve().parent.parent
-        refresh_icon_path = project_root / "resources" / "icons" / "refresh.png"
-        refresh_item.setIcon(QIcon(str(refresh_icon_path)))
-        refresh_item.setText("")
-        refresh_item.setSizeHint(QSize(refresh_size, refresh_size))
-        self.table.setHorizontalHeaderItem(0, refresh_item)
+        if MainWindow._refresh_icon is None:
+            MainWindow._refresh_icon = QIcon(_REFRESH_ICON_PATH)
+        self.file_model.header_icon = MainWindow._refresh_icon
 
         # Click on header[0] = refresh
         header.sectionClicked.connect(self._on_header_clicked)
 
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Fixed row height instead of measuring every row's contents
+        self.table.verticalHeader().setDefaultSectionSize(30)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
 
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #3a3a3a;
                 background-color: #2a2a2a;
                 alternate-background-color: #252525;
                 border: 2px solid #444;
                 border-radius: 5px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #1976D2;
             }
             QHeaderView::section {
@@ -573,25 +596,25 @@ class MainWindow(QMainWindow):
                 border-right: 1px solid #444;
                 font-weight: bold;
             }
-            QTableWidget::indicator {
+            QTableView::indicator {
                 width: 20px;
                 height: 20px;
                 border-radius: 4px;
             }
-            QTableWidget::indicator:unchecked {
+            QTableView::indicator:unchecked {
                 background-color: #333;
                 border: 2px solid #666;
             }
-            QTableWidget::indicator:unchecked:hover {
+            QTableView::indicator:unchecked:hover {
                 background-color: #3a3a3a;
                 border-color: #2196F3;
             }
-            QTableWidget::indicator:checked {
+            QTableView::indicator:checked {
                 background-color: #2196F3;
                 border: 2px solid #2196F3;
                 image: url(none);
             }
-            QTableWidget::indicator:checked:hover {
+            QTableView::indicator:checked:hover {
                 background-color: #42A5F5;
             }
         """)
@@ -753,11 +776,12 @@ class MainWindow(QMainWindow):
 
         right_layout.addLayout(console_header)
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.log_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: 'Consolas', 'Courier New', monospace;
                 font-size: 11px;
                 background: #1a1a1a;
@@ -770,6 +794,12 @@ class MainWindow(QMainWindow):
         self.log_text.setMaximumHeight(200)
         right_layout.addWidget(self.log_text)
 
+        # Coalesces bursts of log messages into one insert
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+
     # ---------------------- Console Toggle ----------------------
 
     def _toggle_console(self) -> None:
@@ -783,19 +813,24 @@ class MainWindow(QMainWindow):
     # ---------------------- Helpers ----------------------
 
     def _append_log(self, text: str) -> None:
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.log_text.setTextCursor(cursor)
-        self.log_text.insertPlainText(text)
+        # Buffered; written to the console at most every 50 ms
+        self._log_buffer.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_buffer(self) -> None:
+        if not self._log_buffer:
+            return
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+        # insertPlainText (not appendPlainText): worker output arrives in
+        # fragments, e.g. print() writes the text and its newline separately
         self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_text.insertPlainText(text)
 
-    def _format_file_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+    def _clear_log(self) -> None:
+        self._log_buffer.clear()
+        self.log_text.clear()
 
     # ---------------------- Credentials ----------------------
 
@@ -814,14 +849,7 @@ class MainWindow(QMainWindow):
         source_type = self.combo_source.currentData()
         self.current_source_type = source_type
 
-        if source_type == "local":
-            self.label_folder_path.show()
-            self.btn_browse_folder.show()
-            self.label_drive_info.hide()
-        else:
-            self.label_folder_path.hide()
-            self.btn_browse_folder.hide()
-            self.label_drive_info.show()
+        self.input_panel.set_drive_mode(source_type != "local")
 
         self._load_files_from_current_source()
 
@@ -835,12 +863,14 @@ class MainWindow(QMainWindow):
 
         if folder:
             self.current_local_path = folder
-            self.label_folder_path.setText(folder)
+            self.input_panel.label_folder_path.setText(folder)
             self._load_files_from_current_source()
 
     def _load_files_from_current_source(self) -> None:
-        self.log_text.clear()
+        self._clear_log()
         self.search_bar.clear()
+        # The loaders below show the full list already
+        self._search_timer.stop()
 
         if self.current_source_type == "local":
             self._load_local_files()
@@ -856,8 +886,7 @@ class MainWindow(QMainWindow):
         else:
             self._append_log(f"✓ Found {len(self.all_files)} file(s)\n")
 
-        self.filtered_files = self.all_files.copy()
-        self._populate_table()
+        self._show_all_files()
 
     def _load_drive_files(self) -> None:
         if not self.api_key or not self.folder_id:
@@ -865,104 +894,125 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", "Drive credentials missing")
             return
 
-        try:
+        if self.drive_worker is not None:
+            # A listing is already in flight; its result will be shown
+            return
+
+        cached = load_cached_drive_files(self.folder_id)
+        self._drive_files_cached = cached is not None
+
+        if cached is not None:
+            # Show the recent listing now; the worker refreshes it below
+            self.all_files = cached
+            self._append_log(
+                f"✓ Found {len(self.all_files)} file(s) (cached, refreshing...)\n"
+            )
+            self._show_all_files()
+        else:
             self._append_log("🔐 Authenticating...\n")
-            self.all_files = get_drive_excel_files(self.api_key, self.folder_id)
+            self.all_files = []
+            self._show_all_files()
+
+            self.btn_run.setEnabled(False)
+            if self.worker is None:
+                self.progress_container.show()
+                self.progress_bar.setRange(0, 0)  # busy indicator
+                self.progress_label.setText("Loading Drive files...")
+
+        self.drive_worker = DriveEnumerationWorker(self.api_key, self.folder_id)
+        self.drive_worker.files_ready.connect(self._on_drive_files_ready)
+        self.drive_worker.error.connect(self._on_drive_files_error)
+        self.drive_worker.finished.connect(self._on_drive_worker_finished)
+        self.drive_worker.start()
+
+    def _on_drive_files_ready(self, files: list) -> None:
+        if self.current_source_type != "drive":
+            # User switched source while the listing was running
+            return
 
-            if not self.all_files:
-                self._append_log("⚠️  No files found\n")
-            else:
-                self._append_log(f"✓ Found {len(self.all_files)} file(s)\n")
+        if self._drive_files_cached:
+            self._drive_files_cached = False
+            unchanged = (
+                [(f.file_id, f.name) for f in files]
+                == [(f.file_id, f.name) for f in self.all_files]
+            )
+            # Keep the cached rows (and their check marks) unless the
+            # listing really changed; [] means the refresh failed
+            if unchanged or not files or self.worker is not None:
+                return
+            self._append_log("🔄 Drive folder changed, list refreshed\n")
 
-            self.filtered_files = self.all_files.copy()
-            self._populate_table()
+        self.all_files = files
 
-        except Exception as e:
-            self._append_log(f"❌ Error: {e}\n")
-            QMessageBox.critical(self, "Error", str(e))
+        if not self.all_files:
+            self._append_log("⚠️  No files found\n")
+        else:
+            self._append_log(f"✓ Found {len(self.all_files)} file(s)\n")
+
+        self._show_all_files()
+
+    def _on_drive_files_error(self, message: str) -> None:
+        self._append_log(f"❌ Error: {message}\n")
+        if not self._drive_files_cached:
+            QMessageBox.critical(self, "Error", message)
+
+    def _on_drive_worker_finished(self) -> None:
+        if self.drive_worker:
+            self.drive_worker.deleteLater()
+            self.drive_worker = None
+
+        if self.worker is None:
+            self.progress_bar.setRange(0, 100)
+            self.progress_container.hide()
+            self.btn_run.setEnabled(True)
 
     # ---------------------- Search ----------------------
 
     def _on_search_changed(self, text: str) -> None:
-        search_text = text.strip().lower()
+        # (Re)start the debounce timer; _apply_search_filter reads the text
+        self._search_timer.start()
+
+    def _apply_search_filter(self) -> None:
+        search_text = self.search_bar.text().strip().lower()
+
+        if search_text == self._applied_search:
+            return
+        self._applied_search = search_text
 
         if not search_text:
-            self.filtered_files = self.all_files.copy()
+            self.filtered_files = self.all_files
         else:
             self.filtered_files = [
-                f for f in self.all_files
-                if search_text in f.name.lower()
+                f for f, name in zip(self.all_files, self._names_lower)
+                if search_text in name
             ]
 
         self._populate_table()
 
+    def _show_all_files(self) -> None:
+        """Show self.all_files unfiltered (after a reload)."""
+        self._names_lower = [f.name_lower for f in self.all_files]
+        self._applied_search = ""
+        self.filtered_files = self.all_files
+        self._populate_table()
+
     # ---------------------- Table Population ----------------------
 
     def _populate_table(self) -> None:
-        self.table.setRowCount(0)
-
-        for row_idx, file_info in enumerate(self.filtered_files):
-            self.table.insertRow(row_idx)
-
-            # Checkbox
-            chk_item = QTableWidgetItem()
-            chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            chk_item.setCheckState(Qt.CheckState.Unchecked)
-            chk_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 0, chk_item)
-
-            # File name
-            name_item = QTableWidgetItem(file_info.name)
-            name_item.setFont(QFont("Segoe UI", 10))
-            self.table.setItem(row_idx, 1, name_item)
-
-            # Source
-            source_text = "📁 Local" if file_info.source_type == "local" else "☁️  Drive"
-            source_item = QTableWidgetItem(source_text)
-            source_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 2, source_item)
-
-            # File size
-            if file_info.local_path and os.path.exists(file_info.local_path):
-                size = os.path.getsize(file_info.local_path)
-                size_text = self._format_file_size(size)
-            else:
-                size_text = "—"
-            size_item = QTableWidgetItem(size_text)
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 3, size_item)
-
-            # Modified date
-            if file_info.local_path and os.path.exists(file_info.local_path):
-                mtime = os.path.getmtime(file_info.local_path)
-                date_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
-            else:
-                date_str = "—"
-            date_item = QTableWidgetItem(date_str)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            date_item.setForeground(QColor("#888"))
-            self.table.setItem(row_idx, 4, date_item)
-
-            # Status (empty initially)
-            status_item = QTableWidgetItem("")
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row_idx, 5, status_item)
-
-        self.table.resizeRowsToContents()
+        # Repaint once after the model reset rather than during it
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.file_model.set_files(self.filtered_files)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     # ---------------------- Selection ----------------------
 
     def _select_all(self) -> None:
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        self.file_model.set_all_checked(True)
 
     def _deselect_all(self) -> None:
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        self.file_model.set_all_checked(False)
 
     # ---------------------- Open Output ----------------------
 
@@ -987,27 +1037,23 @@ class MainWindow(QMainWindow):
     # ---------------------- Run Processing ----------------------
 
     def _on_run_clicked(self) -> None:
-        # Map file name -> list of row indices that were selected
-        self._status_row_map = {}
+        # Map file name -> FileInfo objects that were selected; results are
+        # matched back to rows by object, since the list may change mid-run
+        self._status_file_map = {}
 
+        selected_rows = self.file_model.checked_rows()
         selected_files: List[FileInfo] = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                file_info = self.filtered_files[row]
-                selected_files.append(self.filtered_files[row])
-                self._status_row_map.setdefault(file_info.name, []).append(row)
+        for row in selected_rows:
+            file_info = self.file_model.file_at(row)
+            selected_files.append(file_info)
+            self._status_file_map.setdefault(file_info.name, []).append(file_info)
 
         if not selected_files:
             QMessageBox.warning(self, "No Selection", "Please select at least one file")
             return
 
         # Clear status for the rows that are about to be processed
-        for rows in self._status_row_map.values():
-            for row in rows:
-                status_item = self.table.item(row, 5)
-                if status_item:
-                    status_item.setText("")
+        self.file_model.set_status(selected_rows, "")
 
         self.btn_run.setEnabled(False)
 
@@ -1060,26 +1106,23 @@ class MainWindow(QMainWindow):
 
     def _on_processing_finished(self, results: list) -> None:
         self.progress_container.hide()
-        self.btn_run.setEnabled(True)
+        self.btn_run.setEnabled(self.drive_worker is None)
 
-        # Update status column ONLY for the rows that were actually selected
+        # Update status column ONLY for the files that were actually selected,
+        # as one batched model update
+        statuses = {}
         for result in results:
             name = result.get("source_name")
             if not name:
                 continue
 
-            rows = self._status_row_map.get(name, [])
-            for row in rows:
-                status_item = self.table.item(row, 5)
-                if not status_item:
-                    continue
-
-                if result.get("output_file"):
-                    status_item.setText("✓ Success")
-                    status_item.setForeground(QColor("#4CAF50"))
-                else:
-                    status_item.setText("✗ Failed")
-                    status_item.setForeground(QColor("#F44336"))
+            status = (
+                FileListModel.STATUS_SUCCESS if result.get("output_file")
+                else FileListModel.STATUS_FAILED
+            )
+            for file_info in self._status_file_map.get(name, []):
+                statuses[id(file_info)] = status
+        self.file_model.set_file_statuses(statuses)
 
         # Summary
         success_count = sum(1 for r in results if r.get("output_file"))
@@ -1101,8 +1144,12 @@ class MainWindow(QMainWindow):
 
 
 def launch() -> None:
+    ensure_folders()
+
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    # One app-wide stylesheet: parsed once, shared by every widget
+    app.setStyleSheet(get_dark_theme_stylesheet())
 
     window = MainWindow()
     window.show()
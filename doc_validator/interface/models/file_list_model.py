@@ -0,0 +1,243 @@
+# doc_validator/interface/models/file_list_model.py
+"""
+Table model behind the MainWindow file list.
+
+The model wraps the list of FileInfo objects directly, so showing a new
+list is a single model reset instead of one QTableWidgetItem per cell;
+Qt only asks data() for the rows that are actually visible.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QIcon
+
+from doc_validator.core.input_source_manager import FileInfo
+
+# Shared by every cell, so created once rather than per data() call
+_NAME_FONT = QFont("Segoe UI", 10)
+_MUTED_COLOR = QColor("#888")
+_SOURCE_LOCAL = "📁 Local"
+_SOURCE_DRIVE = "☁️  Drive"
+
+# File size units; unit i covers [1024**i, 1024**(i + 1)) bytes
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+
+class FileListModel(QAbstractTableModel):
+    """
+    Checkable file list: checkbox, name, source, size, modified, status.
+
+    Checked rows are kept as a set of row indices, so collecting the
+    selection costs O(checked) rather than O(rows); statuses live in a
+    list parallel to the wrapped file list.
+    """
+
+    COL_CHECK = 0
+    COL_NAME = 1
+    COL_SOURCE = 2
+    COL_SIZE = 3
+    COL_MODIFIED = 4
+    COL_STATUS = 5
+
+    HEADERS = ["", "File Name", "Source", "Size", "Modified", "Status"]
+
+    # Status values accepted by set_status(): (text, colour)
+    STATUS_SUCCESS = "success"
+    STATUS_FAILED = "failed"
+    _STATUS_DISPLAY = {
+        STATUS_SUCCESS: ("✓ Success", QColor("#4CAF50")),
+        STATUS_FAILED: ("✗ Failed", QColor("#F44336")),
+    }
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+
+        self._files: List[FileInfo] = []
+        self._checked: Set[int] = set()
+        self._status: List[str] = []
+        self._size_text: List[Optional[str]] = []
+        self._modified_text: List[Optional[str]] = []
+
+        # Icon shown in header section 0 (MainWindow uses it as refresh)
+        self.header_icon: Optional[QIcon] = None
+        self.header_icon_size = QSize(32, 32)
+
+    # ---------------------- Qt model interface ----------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.COL_NAME:
+                return self._files[row].name
+            if col == self.COL_SOURCE:
+                return _SOURCE_LOCAL if self._files[row].source_type == "local" else _SOURCE_DRIVE
+            if col == self.COL_SIZE:
+                text = self._size_text[row]
+                if text is None:
+                    text = self._size_text[row] = self._size_display(self._files[row])
+                return text
+            if col == self.COL_MODIFIED:
+                text = self._modified_text[row]
+                if text is None:
+                    text = self._modified_text[row] = self._modified_display(self._files[row])
+                return text
+            if col == self.COL_STATUS:
+                status = self._STATUS_DISPLAY.get(self._status[row])
+                return status[0] if status else ""
+            return None
+
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.COL_CHECK:
+            return Qt.CheckState.Checked if row in self._checked else Qt.CheckState.Unchecked
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and col != self.COL_NAME:
+            return Qt.AlignmentFlag.AlignCenter
+
+        if role == Qt.ItemDataRole.FontRole and col == self.COL_NAME:
+            return _NAME_FONT
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == self.COL_MODIFIED:
+                return _MUTED_COLOR
+            if col == self.COL_STATUS:
+                status = self._STATUS_DISPLAY.get(self._status[row])
+                return status[1] if status else None
+
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if (
+            not index.isValid()
+            or index.column() != self.COL_CHECK
+            or role != Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(index.row())
+        else:
+            self._checked.discard(index.row())
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == self.COL_CHECK:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        if section == self.COL_CHECK:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self.header_icon
+            if role == Qt.ItemDataRole.SizeHintRole:
+                return self.header_icon_size
+        return None
+
+    # ---------------------- Public API ----------------------
+
+    def set_files(self, files: List[FileInfo]) -> None:
+        """Show a new file list; all rows start unchecked with no status."""
+        self.beginResetModel()
+        self._files = files
+        self._checked = set()
+        self._status = [""] * len(files)
+        # Display strings are formatted on first request (visible rows only)
+        self._size_text = [None] * len(files)
+        self._modified_text = [None] * len(files)
+        self.endResetModel()
+
+    def file_at(self, row: int) -> FileInfo:
+        return self._files[row]
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Check or uncheck every row with a single dataChanged signal."""
+        if not self._files:
+            return
+        self._checked = set(range(len(self._files))) if checked else set()
+        self._emit_column_changed(
+            self.COL_CHECK, 0, len(self._files) - 1,
+            [Qt.ItemDataRole.CheckStateRole],
+        )
+
+    def checked_rows(self) -> List[int]:
+        """Row indices that are checked, in table order."""
+        return sorted(self._checked)
+
+    def set_status(self, rows: Iterable[int], status: str) -> None:
+        """Set the status ("", STATUS_SUCCESS or STATUS_FAILED) of rows."""
+        self.set_statuses(dict.fromkeys(rows, status))
+
+    def set_statuses(self, statuses: Dict[int, str]) -> None:
+        """Apply {row: status} updates with a single dataChanged signal."""
+        # Rows past the end belong to a list that has since been replaced
+        statuses = {row: s for row, s in statuses.items() if 0 <= row < len(self._files)}
+        if not statuses:
+            return
+        for row, status in statuses.items():
+            self._status[row] = status
+        self._emit_column_changed(
+            self.COL_STATUS, min(statuses), max(statuses),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+        )
+
+    def set_file_statuses(self, statuses: Dict[int, str]) -> None:
+        """
+        Apply {id(FileInfo): status} updates to the rows showing those files.
+
+        Rows are looked up when the results arrive, so a list refreshed or
+        filtered while a run was in progress still gets the right rows (and
+        files no longer shown are skipped).
+        """
+        self.set_statuses({
+            row: statuses[id(file_info)]
+            for row, file_info in enumerate(self._files)
+            if id(file_info) in statuses
+        })
+
+    # ---------------------- Helpers ----------------------
+
+    def _emit_column_changed(self, column: int, first: int, last: int, roles) -> None:
+        self.dataChanged.emit(
+            self.index(first, column), self.index(last, column), roles
+        )
+
+    @classmethod
+    def _size_display(cls, file_info: FileInfo) -> str:
+        if file_info.size_bytes is None:
+            return "—"
+        return cls._format_file_size(file_info.size_bytes)
+
+    @staticmethod
+    def _modified_display(file_info: FileInfo) -> str:
+        if file_info.mtime is None:
+            return "—"
+        return datetime.fromtimestamp(file_info.mtime).strftime("%Y-%m-%d %H:%M")
+
+    @staticmethod
+    def _format_file_size(size_bytes: int) -> str:
+        """Format file size in human-readable format."""
+        # Unit index straight from the bit length instead of dividing in a loop
+        i = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / _SIZE_DIVISORS[i]:.1f} {_SIZE_UNITS[i]}"
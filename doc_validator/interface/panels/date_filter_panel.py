@@ -3,9 +3,10 @@ from __future__ import annotations
 from datetime import date
 from typing import Optional, Tuple
 
-from PyQt6.QtCore import QDate, pyqtSignal, Qt
+from PyQt6.QtCore import QDate, pyqtSignal, pyqtSlot, Qt
 from PyQt6.QtWidgets import (
     QGroupBox,
+    QFormLayout,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
@@ -33,19 +34,8 @@ class DateFilterPanel(QGroupBox):
     def __init__(self, parent=None):
         super().__init__("Date Filter (Optional)", parent)
 
-        self.setStyleSheet("""
-                    QGroupBox {
-                        border: none;          /* no rectangle around it */
-                        margin-top: 0px;
-                    }
-                    QGroupBox::title {
-                        subcontrol-origin: margin;
-                        left: 0px;
-                        padding: 0 0 4px 0;
-                        color: #2196F3;
-                        font-weight: bold;
-                    }
-                """)
+        # Styled by the dark theme (QGroupBox#dateFilterGroup)
+        self.setObjectName("dateFilterGroup")
 
         self._build_ui()
 
@@ -73,44 +63,49 @@ class DateFilterPanel(QGroupBox):
         top_row.addStretch()
         layout.addLayout(top_row)
 
-        # Second row: From / To
-        dates_row = QHBoxLayout()
+        # From / To rows (QFormLayout: fixed label/field columns)
+        today = QDate.currentDate()
 
-        start_label = QLabel("From:")
-        start_initial = QDate.currentDate().addMonths(-1)
+        start_initial = today.addMonths(-1)
         self.date_start = SmartDateLineEdit(start_initial)
         self.date_start.setEnabled(False)
 
-        end_label = QLabel("To:")
-        end_initial = QDate.currentDate()
+        end_initial = today
         self.date_end = SmartDateLineEdit(end_initial)
         self.date_end.setEnabled(False)
 
-        dates_row.addWidget(start_label)
-        dates_row.addWidget(self.date_start)
-        dates_row.addSpacing(20)
-        dates_row.addWidget(end_label)
-        dates_row.addWidget(self.date_end)
-        dates_row.addStretch()
+        dates_form = QFormLayout()
+        dates_form.setContentsMargins(0, 0, 0, 0)
+        dates_form.setHorizontalSpacing(12)
+        dates_form.addRow("From:", self.date_start)
+        dates_form.addRow("To:", self.date_end)
 
-        layout.addLayout(dates_row)
+        layout.addLayout(dates_form)
 
         # Hint row
         hint = QLabel("Filter rows by action_date. Format: YYYY-MM-DD or +/-Nd/M/Y")
-        hint.setStyleSheet("color: gray; font-size: 10px;")
+        hint.setObjectName("dateFilterHint")
         layout.addWidget(hint)
 
         # Connections
-        self.chk_enable.stateChanged.connect(self._on_toggle)
+        # Same-thread hops: skip AutoConnection's thread check
+        self.chk_enable.toggled.connect(
+            self._on_toggle, Qt.ConnectionType.DirectConnection
+        )
 
     # ------------------------------------------------------------------ #
     # Behaviour
     # ------------------------------------------------------------------ #
 
-    def _on_toggle(self, state: int) -> None:
-        enabled = bool(state)
-        self.date_start.setEnabled(enabled)
-        self.date_end.setEnabled(enabled)
+    @pyqtSlot(bool)
+    def _on_toggle(self, enabled: bool) -> None:
+        # One repaint for both fields instead of one each
+        self.setUpdatesEnabled(False)
+        try:
+            self.date_start.setEnabled(enabled)
+            self.date_end.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
         self.filter_toggled.emit(enabled)
 
     # ------------------------------------------------------------------ #
@@ -134,14 +129,5 @@ class DateFilterPanel(QGroupBox):
         if not self.is_enabled():
             return None, None
 
-        start = end = None
-
-        text_start = self.date_start.text().strip()
-        text_end = self.date_end.text().strip()
-
-        if text_start:
-            start = self.date_start.resolve_date()
-        if text_end:
-            end = self.date_end.resolve_date()
-
-        return start, end
+        # Empty fields resolve to None
+        return self.date_start.resolve_date(), self.date_end.resolve_date()
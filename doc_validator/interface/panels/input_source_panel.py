@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QComboBox,
     QGroupBox,
+    QListView,
     QSizePolicy,
 )
 
@@ -25,27 +26,14 @@ class InputSourcePanel(QGroupBox):
     def __init__(self, parent: Optional[QWidget] = None, default_path: str = "") -> None:
         super().__init__("📂 Input Source", parent)
 
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #444;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding: 15px;
-                background: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #2196F3;
-            }
-        """)
+        # Styled by the dark theme (QGroupBox#inputSourceGroup)
+        self.setObjectName("inputSourceGroup")
 
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(8)
         self.setLayout(main_layout)
+        self._main_layout = main_layout
 
         # ---- Source type row ----
         source_row = QHBoxLayout()
@@ -54,36 +42,29 @@ class InputSourcePanel(QGroupBox):
         self.combo_source = QComboBox(self)
         self.combo_source.addItem("📁 Local Folder (INPUT)", "local")
         self.combo_source.addItem("☁️  Google Drive", "drive")
-        self.combo_source.setStyleSheet("""
-            QComboBox {
-                padding: 5px 10px;
-                border: 2px solid #444;
-                border-radius: 5px;
-                background: #333;
-                min-width: 0px;   /* let fixed width control the size */
-            }
-            QComboBox:hover {
-                border-color: #2196F3;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-        """)
-        # make the combo just wide enough for its content + a bit
+        # Keep the popup cheap to lay out if more sources are ever added
+        self.combo_source.setMaxVisibleItems(12)
+        source_view = self.combo_source.view()
+        if isinstance(source_view, QListView):
+            source_view.setUniformItemSizes(True)
+            source_view.setLayoutMode(QListView.LayoutMode.Batched)
+            source_view.setBatchSize(32)
+        self.combo_source.setObjectName("sourceCombo")
+        # make the combo just wide enough for its content
+        # (width is fixed in showEvent, once the app stylesheet applies)
         self.combo_source.setSizeAdjustPolicy(
             QComboBox.SizeAdjustPolicy.AdjustToContents
         )
-        hint_width = self.combo_source.sizeHint().width()
-        self.combo_source.setFixedWidth(hint_width + 30)
+        self._combo_width_fixed = False
 
         source_row.addWidget(self.combo_source)
         source_row.addStretch()
         main_layout.addLayout(source_row)
 
         # ---- Hidden folder path (kept for logic, not shown) ----
-        self.label_folder_path = QLabel(default_path or "—")
-        self.label_folder_path.hide()
+        # Created on first access, like the Drive info label below
+        self._default_path = default_path or "—"
+        self._label_folder_path: Optional[QLabel] = None
 
         # ---- Buttons row: Browse + Open Output ----
         buttons_row = QHBoxLayout()
@@ -92,16 +73,57 @@ class InputSourcePanel(QGroupBox):
         buttons_row.addWidget(self.btn_browse_folder)
 
         self.btn_open_output = QPushButton("📂 Open Output")
-        self.btn_open_output.clicked.connect(self.open_output_clicked.emit)
+        self.btn_open_output.clicked.connect(
+            self._forward_open_output, Qt.ConnectionType.DirectConnection
+        )
         buttons_row.addWidget(self.btn_open_output)
 
         buttons_row.addStretch()
         main_layout.addLayout(buttons_row)
 
-        # ---- Drive info ----
-        self.label_drive_info = QLabel("☁️  Using configured Google Drive folder")
-        self.label_drive_info.setStyleSheet("color: #4CAF50; font-style: italic;")
-        self.label_drive_info.hide()  # start hidden (local mode)
-        main_layout.addWidget(self.label_drive_info)
+        # ---- Drive info (created when Drive mode is first shown) ----
+        self._label_drive_info: Optional[QLabel] = None
 
         # main_layout.addStretch()
+
+    # ------------------------------------------------------------------ #
+    # Lazily created labels
+    # ------------------------------------------------------------------ #
+
+    @property
+    def label_folder_path(self) -> QLabel:
+        if self._label_folder_path is None:
+            self._label_folder_path = QLabel(self._default_path, self)
+            self._label_folder_path.hide()
+        return self._label_folder_path
+
+    @property
+    def label_drive_info(self) -> QLabel:
+        if self._label_drive_info is None:
+            label = QLabel("☁️  Using configured Google Drive folder")
+            label.setObjectName("driveInfoLabel")
+            label.hide()  # callers show it in Drive mode
+            self._main_layout.addWidget(label)
+            self._label_drive_info = label
+        return self._label_drive_info
+
+    def set_drive_mode(self, drive: bool) -> None:
+        """Show the Drive info line (Drive source) or the Browse button (local)."""
+        self.btn_browse_folder.setVisible(not drive)
+        if drive:
+            self.label_drive_info.show()
+        elif self._label_drive_info is not None:
+            self._label_drive_info.hide()
+
+    @pyqtSlot()
+    def _forward_open_output(self) -> None:
+        self.open_output_clicked.emit()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._combo_width_fixed:
+            # sizeHint() here already includes the themed drop-down area
+            # (20px + 10px padding), so no extra slack is added
+            self._combo_width_fixed = True
+            hint_width = self.combo_source.sizeHint().width()
+            self.combo_source.setFixedWidth(hint_width)
@@ -1,13 +1,25 @@
 import re
-import calendar
 from datetime import date, datetime, timedelta
+from typing import Optional
 
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QSignalBlocker, pyqtSlot
 from PyQt6.QtWidgets import (
     QLineEdit,
     QDialog, QVBoxLayout, QDialogButtonBox, QCalendarWidget
 )
 
+# Relative offsets: +Nd / -Nm / +Ny (unit is case-insensitive)
+_REL_RE = re.compile(r"([+-])(\d+)([dmyDMY])")
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _last_day(year: int, month: int) -> int:
+    """Number of days in the given month (leap years included)."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
 
 class SmartDateLineEdit(QLineEdit):
     """
@@ -25,14 +37,21 @@ class SmartDateLineEdit(QLineEdit):
             initial_qdate = QDate.currentDate()
 
         self._last_valid_date: date = initial_qdate.toPyDate()
+
+        # Calendar popup, built on first double-click and then reused
+        self._cal_dlg: QDialog | None = None
+        self._cal_widget: QCalendarWidget | None = None
         self.setText(initial_qdate.toString("yyyy-MM-dd"))
         self.setPlaceholderText("YYYY-MM-DD or +/-Nd/M/Y")
 
         # ENTER: resolve relative date immediately
-        self.returnPressed.connect(self._on_return_pressed)
+        self.returnPressed.connect(
+            self._on_return_pressed, Qt.ConnectionType.DirectConnection
+        )
 
-        # Start life in "select all" state
-        self.selectAll()
+        # Start life in "select all" state (applied on first show, so no
+        # selection geometry is computed for a widget that isn't visible)
+        self._initial_selected = False
 
     # ---------------------------------------------------------
     # Focus & mouse behaviour
@@ -50,6 +69,17 @@ class SmartDateLineEdit(QLineEdit):
         reason = getattr(event, "reason", lambda: Qt.FocusReason.OtherFocusReason)()
         if reason != Qt.FocusReason.MouseFocusReason:
             # e.g. Tab focus or we call setFocus() from code
+            self._select_all_text()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._initial_selected:
+            self._initial_selected = True
+            self._select_all_text()
+
+    def _select_all_text(self):
+        """selectAll(), skipped when the whole text is already selected."""
+        if self.selectedText() != self.text():
             self.selectAll()
 
     def mouseDoubleClickEvent(self, event):
@@ -61,14 +91,12 @@ class SmartDateLineEdit(QLineEdit):
     # Calendar popup
     # ---------------------------------------------------------
 
-    def _open_calendar_popup(self):
+    def _build_calendar_popup(self) -> None:
         dlg = QDialog(self)
         dlg.setWindowTitle("Select date")
         layout = QVBoxLayout(dlg)
 
         cal = QCalendarWidget(dlg)
-        d = self._last_valid_date
-        cal.setSelectedDate(QDate(d.year, d.month, d.day))
         layout.addWidget(cal)
 
         buttons = QDialogButtonBox(
@@ -81,11 +109,22 @@ class SmartDateLineEdit(QLineEdit):
         buttons.accepted.connect(dlg.accept)
         buttons.rejected.connect(dlg.reject)
 
-        if dlg.exec():
+        self._cal_dlg = dlg
+        self._cal_widget = cal
+
+    def _open_calendar_popup(self):
+        if self._cal_dlg is None:
+            self._build_calendar_popup()
+
+        cal = self._cal_widget
+        d = self._last_valid_date
+        cal.setSelectedDate(QDate(d.year, d.month, d.day))
+
+        if self._cal_dlg.exec():
             qd = cal.selectedDate()
             self._update_from_date(qd.toPyDate())
             # After choosing from calendar → select all again
-            self.selectAll()
+            self._select_all_text()
 
     # ---------------------------------------------------------
     # Date parsing
@@ -93,24 +132,29 @@ class SmartDateLineEdit(QLineEdit):
 
     def _update_from_date(self, new_date: date):
         self._last_valid_date = new_date
-        self.setText(new_date.strftime("%Y-%m-%d"))
+        # Our own update: don't emit textChanged back out
+        with QSignalBlocker(self):
+            self.setText(f"{new_date.year:04d}-{new_date.month:02d}-{new_date.day:02d}")
 
-    def resolve_date(self) -> date:
+    def resolve_date(self, text: Optional[str] = None) -> Optional[date]:
         """
-        Parse current text.
+        Parse current text (or an already-stripped ``text``).
 
         Supports:
             - YYYY-MM-DD (absolute)
             - +Nd / -Nd  (days)
             - +Nm / -Nm  (months)
             - +Ny / -Ny  (years)
+
+        Returns None for empty input.
         """
-        text = self.text().strip()
+        if text is None:
+            text = self.text().strip()
         if not text:
-            raise ValueError("Empty date")
+            return None
 
         # Relative pattern
-        m = re.fullmatch(r"([+-])(\d+)([dmyDMy])", text)
+        m = _REL_RE.fullmatch(text)
         base = self._last_valid_date
 
         if m:
@@ -124,28 +168,32 @@ class SmartDateLineEdit(QLineEdit):
                 result = base + timedelta(days=n)
 
             elif unit == "m":
-                month = base.month + n
-                year = base.year
-                while month > 12:
-                    month -= 12
-                    year += 1
-                while month < 1:
-                    month += 12
-                    year -= 1
-                last_day = calendar.monthrange(year, month)[1]
+                # floor division also handles negative offsets
+                year_offset, month_index = divmod(base.month - 1 + n, 12)
+                year = base.year + year_offset
+                month = month_index + 1
+                last_day = _last_day(year, month)
                 day = min(base.day, last_day)
                 result = date(year, month, day)
 
             else:  # 'y'
                 year = base.year + n
                 month = base.month
-                last_day = calendar.monthrange(year, month)[1]
+                last_day = _last_day(year, month)
                 day = min(base.day, last_day)
                 result = date(year, month, day)
 
         else:
-            # Absolute format
-            result = datetime.strptime(text, "%Y-%m-%d").date()
+            # Absolute format; zero-padded YYYY-MM-DD is sliced directly
+            if (
+                    len(text) == 10
+                    and text[4] == "-" and text[7] == "-"
+                    and (text[:4] + text[5:7] + text[8:]).isdigit()
+            ):
+                result = date(int(text[:4]), int(text[5:7]), int(text[8:]))
+            else:
+                # Non-padded forms such as 2024-1-5
+                result = datetime.strptime(text, "%Y-%m-%d").date()
 
         self._update_from_date(result)
         return result
@@ -154,6 +202,7 @@ class SmartDateLineEdit(QLineEdit):
     # ENTER key behaviour
     # ---------------------------------------------------------
 
+    @pyqtSlot()
     def _on_return_pressed(self):
         """
         When user hits Enter:
@@ -162,8 +211,8 @@ class SmartDateLineEdit(QLineEdit):
           - keep 'select all' active so they can immediately retype
         """
         try:
-            self.resolve_date()
-            self.selectAll()
+            if self.resolve_date() is not None:
+                self._select_all_text()
         except ValueError:
             # Invalid / incomplete input → do nothing, let user keep editing
             pass
@@ -3,6 +3,7 @@
 Background worker threads for the AMOSFilter GUI.
 """
 
+from .drive_enumeration_worker import DriveEnumerationWorker
 from .processing_worker import ProcessingWorker
 
-__all__ = ["ProcessingWorker"]
\ No newline at end of file
+__all__ = ["DriveEnumerationWorker", "ProcessingWorker"]
\ No newline at end of file
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal, QObject
+
+from doc_validator.core.input_source_manager import (
+    get_drive_excel_files,
+    save_drive_files_cache,
+)
+
+
+class DriveEnumerationWorker(QThread):
+    """
+    Background worker that lists the Excel files of a Drive folder, so the
+    network round-trips do not block the GUI thread. A successful listing
+    is also written to the Drive listing cache.
+    """
+
+    files_ready = pyqtSignal(list)  # List[FileInfo]
+    error = pyqtSignal(str)
+
+    def __init__(
+            self,
+            api_key: str,
+            folder_id: str,
+            parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self.api_key = api_key
+        self.folder_id = folder_id
+
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            files = get_drive_excel_files(self.api_key, self.folder_id)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        # get_drive_excel_files returns [] on failure; don't cache that
+        if files:
+            save_drive_files_cache(self.folder_id, files)
+        self.files_ready.emit(files)
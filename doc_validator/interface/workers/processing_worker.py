@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from typing import List, Dict, Any, Optional
 
+import os
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from PyQt6.QtCore import QThread, pyqtSignal, QObject, Qt
 
+from doc_validator.config import DRIVE_DOWNLOAD_MAX_WORKERS
 from doc_validator.core.drive_io import (
     authenticate_drive_api,
     download_file_from_drive,
+    get_files_metadata,
+    get_thread_http,
 )
 from doc_validator.core.excel_pipeline import (
     process_excel,
@@ -38,25 +45,67 @@ class EmittingStream:
     A file-like stream that sends written text to a Qt signal.
     Used to capture print() output from existing code and mirror it
     into the GUI log window, while still printing to real stdout.
+
+    Writes are buffered and sent as one signal per block: a block goes
+    out on a completed line once FLUSH_INTERVAL has passed since the last
+    one or FLUSH_SIZE characters are pending, and on flush().
     """
 
+    FLUSH_INTERVAL = 0.025  # seconds (~40 signals per second at most)
+    FLUSH_SIZE = 16384  # characters
+
     def __init__(self, emitter: LogEmitter, original_stream):
         self.emitter = emitter
         self.original_stream = original_stream
+        self._buf: List[str] = []
+        self._buf_len = 0
+        self._last_emit = 0.0
+        # stdout is process-wide, so the GUI thread may write here too
+        self._lock = threading.Lock()
 
     def write(self, text: str):
         if not text:
             return
-        # Emit to GUI
-        self.emitter.message.emit(text)
-        # Also forward to the original stream so IDE / console still see it
+        # Forward to the original stream so IDE / console still see it
         if self.original_stream is not None:
             self.original_stream.write(text)
 
+        with self._lock:
+            self._buf.append(text)
+            self._buf_len += len(text)
+            # Partial lines wait for the rest of the line
+            if "\n" not in text:
+                return
+            now = time.monotonic()
+            if (
+                self._buf_len < self.FLUSH_SIZE
+                and now - self._last_emit < self.FLUSH_INTERVAL
+            ):
+                return
+            block = self._take_buffer(now)
+        self.emitter.message.emit(block)
+
+    def flush_pending(self) -> None:
+        """Send whatever is buffered to the GUI now."""
+        with self._lock:
+            if not self._buf:
+                return
+            block = self._take_buffer(time.monotonic())
+        self.emitter.message.emit(block)
+
     def flush(self):
+        self.flush_pending()
         if self.original_stream is not None:
             self.original_stream.flush()
 
+    def _take_buffer(self, now: float) -> str:
+        """Empty the buffer and return its text (caller holds the lock)."""
+        block = "".join(self._buf)
+        self._buf = []
+        self._buf_len = 0
+        self._last_emit = now
+        return block
+
 
 # ---------------------------------------------------------------------
 # Worker thread to process selected files
@@ -77,6 +126,9 @@ class ProcessingWorker(QThread):
     progress_updated = pyqtSignal(int, str)  # percentage (0-100), status text
     finished_with_results = pyqtSignal(list)
 
+    # Minimum seconds between log-driven progress updates (~10 Hz)
+    PROGRESS_INTERVAL = 0.1
+
     def __init__(
             self,
             api_key: Optional[str],
@@ -102,6 +154,14 @@ class ProcessingWorker(QThread):
         self._line_count = 0
         self._estimated_lines_per_file = 50
 
+        # Last progress sent from _emit_log_and_count (rate limited)
+        self._last_pct = -1
+        self._last_status = ""
+        self._last_progress_ts = 0.0
+
+        # Captured stdout while run() is active (see _emit_log_and_count)
+        self._stream: Optional[EmittingStream] = None
+
     # ------------------------------------------------------------------
     # Public control API
     # ------------------------------------------------------------------
@@ -121,6 +181,12 @@ class ProcessingWorker(QThread):
         if not message:
             return
 
+        # A direct call from run(): send any buffered print() output first
+        # so the log keeps its order
+        stream = self._stream
+        if stream is not None and QThread.currentThread() is self:
+            stream.flush_pending()
+
         self.log_message.emit(message)
 
         # Count lines in this message
@@ -138,7 +204,17 @@ class ProcessingWorker(QThread):
             progress = 0
 
         # Extract first line as a short status text
-        status = message.split("\n")[0].strip()[:60] or "Processing..."
+        status = message.split("\n", 1)[0].strip()[:60] or "Processing..."
+
+        # Only send changes, at most PROGRESS_INTERVAL apart
+        if progress == self._last_pct and status == self._last_status:
+            return
+        now = time.monotonic()
+        if now - self._last_progress_ts < self.PROGRESS_INTERVAL:
+            return
+        self._last_pct = progress
+        self._last_status = status
+        self._last_progress_ts = now
         self.progress_updated.emit(progress, status)
 
     def _detect_if_combined(self, local_path: str) -> bool:
@@ -174,6 +250,90 @@ class ProcessingWorker(QThread):
             )
             return False
 
+    def _download(
+            self,
+            drive_service,
+            file_info: FileInfo,
+            file_meta: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Download one Drive file (runs in the download pool).
+
+        Each file gets its own temp_gui/<file_id> folder: Drive allows
+        several files with the same name, and they download concurrently.
+
+        Returns:
+            Local path of the file, or None if the download failed
+        """
+        return download_file_from_drive(
+            drive_service,
+            file_info.file_id,
+            os.path.join("temp_gui", file_info.file_id),
+            file_info.name,
+            http=get_thread_http(),
+            file_meta=file_meta,
+        )
+
+    def _process(
+            self,
+            local_path: str,
+            file_info: FileInfo,
+            run_time: datetime,
+    ) -> Optional[str]:
+        """
+        Validate one file on disk, splitting it first if it is combined.
+
+        Returns:
+            Output file path (the first one for combined files), or None
+        """
+        # ========== AUTO-DETECT: Combined vs Single ==========
+        is_combined = self._detect_if_combined(local_path)
+
+        if is_combined:
+            # Process as combined file (multiple workpacks)
+            output_files = process_combined_excel(
+                local_path,
+                filter_start_date=self.filter_start_date,
+                filter_end_date=self.filter_end_date,
+                enable_action_step_control=self.enable_action_step_control,
+                run_time=run_time,
+            )
+
+            if output_files:
+                self._emit_log_and_count(
+                    f"✓ Combined file processing finished for {file_info.name}\n"
+                    f"  Created {len(output_files)} output file(s)\n"
+                )
+                # Store first output file as representative
+                output_file = output_files[0] if output_files else None
+            else:
+                self._emit_log_and_count(
+                    f"✗ Combined file processing failed for {file_info.name}\n"
+                )
+                output_file = None
+
+        else:
+            # Process as single workpack file
+            output_file = process_excel(
+                local_path,
+                filter_start_date=self.filter_start_date,
+                filter_end_date=self.filter_end_date,
+                enable_action_step_control=self.enable_action_step_control,
+                run_time=run_time,
+            )
+
+            if output_file:
+                self._emit_log_and_count(
+                    f"✓ Processing finished for {file_info.name}\n"
+                    f"  Output: {output_file}\n"
+                )
+            else:
+                self._emit_log_and_count(
+                    f"✗ Processing failed for {file_info.name}\n"
+                )
+
+        return output_file
+
     # ------------------------------------------------------------------
     # QThread.run
     # ------------------------------------------------------------------
@@ -189,10 +349,17 @@ class ProcessingWorker(QThread):
         original_stderr = sys.stderr
         emitter = LogEmitter()
         stream = EmittingStream(emitter, original_stdout)
-        emitter.message.connect(self._emit_log_and_count, Qt.ConnectionType.QueuedConnection)
+        # Direct: blocks are already batched, and log_message itself is
+        # queued to the GUI, so the final flush cannot be dropped by the
+        # disconnect below
+        emitter.message.connect(self._emit_log_and_count, Qt.ConnectionType.DirectConnection)
+        self._stream = stream
         sys.stdout = stream
         sys.stderr = stream
 
+        download_pool: Optional[ThreadPoolExecutor] = None
+        downloads: Dict[int, Future] = {}
+
         try:
             # ========== INITIALIZE VALIDATION ENGINE ==========
             # Check if validation engine is already initialized
@@ -229,6 +396,7 @@ class ProcessingWorker(QThread):
             # Check if we need Drive authentication
             need_drive = any(f.source_type == "drive" for f in self.selected_files)
             drive_service = None
+            drive_metadata: Dict[str, Dict[str, Any]] = {}
 
             if need_drive:
                 if not self.api_key or not self.folder_id:
@@ -243,9 +411,39 @@ class ProcessingWorker(QThread):
                 self._emit_log_and_count("✓ Authentication successful.\n\n")
                 self.progress_updated.emit(10, "Authentication successful")
 
+                # One batched metadata lookup lets unchanged files be
+                # served from the local download cache
+                drive_metadata = get_files_metadata(
+                    drive_service,
+                    [f.file_id for f in self.selected_files if f.source_type == "drive"],
+                )
+
+            # ========== PREFETCH DRIVE FILES ==========
+            # Downloads run in a small thread pool (one HTTP connection per
+            # thread) while this thread processes the files already on disk
+            drive_files = [
+                (i, f) for i, f in enumerate(self.selected_files)
+                if f.source_type == "drive"
+            ]
+            if drive_service and drive_files:
+                download_pool = ThreadPoolExecutor(
+                    max_workers=min(DRIVE_DOWNLOAD_MAX_WORKERS, len(drive_files)),
+                    thread_name_prefix="gui-download",
+                )
+                downloads = {
+                    i: download_pool.submit(
+                        self._download,
+                        drive_service,
+                        f,
+                        drive_metadata.get(f.file_id),
+                    )
+                    for i, f in drive_files
+                }
+
             # ========== PROCESS FILES ==========
             total = len(self.selected_files)
             self._emit_log_and_count(f"Processing {total} selected file(s)...\n")
+            run_time = datetime.now()  # shared by all outputs of this run
 
             for idx, file_info in enumerate(self.selected_files, start=1):
                 if self._cancelled:
@@ -275,8 +473,9 @@ class ProcessingWorker(QThread):
                     self._emit_log_and_count(f"Local file: {local_path}\n")
 
                 elif file_info.source_type == "drive":
-                    # Drive file - need to download
-                    if not drive_service:
+                    # Drive file - wait for its download
+                    download = downloads.get(idx - 1)
+                    if download is None:
                         self._emit_log_and_count(
                             "✗ ERROR: Drive service not initialized\n"
                         )
@@ -289,13 +488,7 @@ class ProcessingWorker(QThread):
                         continue
 
                     self._emit_log_and_count(f"Downloading from Drive...\n")
-                    wp_placeholder = "temp_gui"
-                    local_path = download_file_from_drive(
-                        drive_service,
-                        file_info.file_id,
-                        wp_placeholder,
-                        file_info.name,
-                    )
+                    local_path = download.result()
 
                     if not local_path:
                         self._emit_log_and_count(
@@ -311,49 +504,7 @@ class ProcessingWorker(QThread):
 
                     self._emit_log_and_count(f"Downloaded to: {local_path}\n")
 
-                # ========== AUTO-DETECT: Combined vs Single ==========
-                is_combined = self._detect_if_combined(local_path)
-
-                if is_combined:
-                    # Process as combined file (multiple workpacks)
-                    output_files = process_combined_excel(
-                        local_path,
-                        filter_start_date=self.filter_start_date,
-                        filter_end_date=self.filter_end_date,
-                        enable_action_step_control=self.enable_action_step_control,
-                    )
-
-                    if output_files:
-                        self._emit_log_and_count(
-                            f"✓ Combined file processing finished for {file_info.name}\n"
-                            f"  Created {len(output_files)} output file(s)\n"
-                        )
-                        # Store first output file as representative
-                        output_file = output_files[0] if output_files else None
-                    else:
-                        self._emit_log_and_count(
-                            f"✗ Combined file processing failed for {file_info.name}\n"
-                        )
-                        output_file = None
-
-                else:
-                    # Process as single workpack file
-                    output_file = process_excel(
-                        local_path,
-                        filter_start_date=self.filter_start_date,
-                        filter_end_date=self.filter_end_date,
-                        enable_action_step_control=self.enable_action_step_control,
-                    )
-
-                    if output_file:
-                        self._emit_log_and_count(
-                            f"✓ Processing finished for {file_info.name}\n"
-                            f"  Output: {output_file}\n"
-                        )
-                    else:
-                        self._emit_log_and_count(
-                            f"✗ Processing failed for {file_info.name}\n"
-                        )
+                output_file = self._process(local_path, file_info, run_time)
 
                 results.append({
                     "source_name": file_info.name,
@@ -371,7 +522,13 @@ class ProcessingWorker(QThread):
             self._emit_log_and_count(f"\n✗ ERROR: {exc!r}\n")
             self._emit_log_and_count(traceback.format_exc())
         finally:
-            # Restore stdout/stderr
+            if download_pool is not None:
+                # Drop queued downloads (e.g. after cancel); running ones finish
+                download_pool.shutdown(wait=True, cancel_futures=True)
+
+            # Restore stdout/stderr, sending any buffered output first
+            stream.flush_pending()
+            self._stream = None
             sys.stdout = original_stdout
             sys.stderr = original_stderr
 
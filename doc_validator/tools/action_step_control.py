@@ -66,9 +66,7 @@ def compute_action_step_control_df(
                 return None
         return int(m.group(1))
 
-    def _parse_action_datetime(row, date_col='action_date', time_col='action_time'):
-        d = row.get(date_col, "")
-        t = row.get(time_col, "")
+    def _parse_action_datetime(d, t):
         if (d is None or str(d).strip() == "") and (t is None or str(t).strip() == ""):
             return pd.NaT
         combined = f"{d} {t}".strip()
@@ -125,10 +123,12 @@ def compute_action_step_control_df(
     # 5) internal compute columns (same as your current code)
     df_work = df.copy()
     df_work['_workstep_num'] = df_work[workstep_col].apply(_parse_workstep)
-    df_work['action_datetime'] = df_work.apply(
-        lambda r: _parse_action_datetime(r, date_col=date_col, time_col=time_col),
-        axis=1,
-    )
+    # zip over the two columns instead of apply(axis=1), which builds a
+    # Series for every row
+    df_work['action_datetime'] = [
+        _parse_action_datetime(d, t)
+        for d, t in zip(df_work[date_col], df_work[time_col])
+    ]
     if text_col and text_col in df_work.columns:
         df_work['_substep_num'] = df_work[text_col].apply(_extract_substep_num)
     else:
@@ -12,6 +12,7 @@ Example:
 
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 
 from doc_validator.core.excel_pipeline import process_excel
@@ -84,6 +85,7 @@ def process_local_batch(folder_path, enable_action_step_control: bool = True):
 
     processed_files = []
     failed_files = []
+    run_time = datetime.now()  # shared by all outputs of this batch
 
     for i, file_path in enumerate(excel_files, 1):
         print(f"\n{'=' * 60}")
@@ -94,6 +96,7 @@ def process_local_batch(folder_path, enable_action_step_control: bool = True):
             output_path = process_excel(
                 file_path,
                 enable_action_step_control=enable_action_step_control,
+                run_time=run_time,
             )
 
             if output_path:
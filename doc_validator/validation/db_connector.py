@@ -26,6 +26,12 @@ class DBConnector:
         self.connection_string = connection_string
         self._connection: Optional[pyodbc.Connection] = None
 
+    def __getstate__(self):
+        """Pickle without the live connection; it reconnects on demand."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
     def connect(self) -> None:
         """Establish database connection."""
         try:
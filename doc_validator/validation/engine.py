@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 from .helpers import (
     fix_common_typos,
     has_revision,
@@ -8,6 +11,8 @@ from .helpers import (
     has_data_module_task,
     contains_skip_phrase,
     contains_header_skip_keyword,
+    header_skip_keyword_mask,
+    skip_phrase_mask,
     has_referenced_pattern,
     has_iaw_keyword,
     is_seq_auto_valid,
@@ -133,15 +138,25 @@ def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None, st
     if contains_skip_phrase(stripped):
         return "Valid"
 
-    # ========== STEP 4: Fix typos ==========
-    cleaned = fix_common_typos(stripped)
+    return _check_ref_text(stripped, seq_value, des_text)
+
+
+def _check_ref_text(stripped, seq_value=None, des_text=None):
+    """
+    Steps 4-6 of check_ref_keywords() for a stripped action text that is
+    not N/A/blank and contains no skip phrase.
 
+    Shared by the scalar and vectorized validators so both stay in sync.
+    """
     # ========== STEP 4A: Check for ordering/procurement patterns (ALL SEQs including 9.x) ==========
     # These patterns indicate should be Valid for all SEQ types
     upper_text = stripped.upper()
     if 'ORDERED SPARE' or 'GET ACCESS DAMAGE AREA' or '-GET ACCESS DAMAGE AREA' in upper_text:
         return "Valid"
 
+    # ========== STEP 4: Fix typos ==========
+    cleaned = fix_common_typos(stripped)
+
     # ========== STEP 4B: Execution-only answers (non-9.x SEQ) ==========
     # For non-9.x SEQ, check if this is a valid execution-only response
     # This must happen BEFORE we check DES/primary reference enforcement
@@ -225,4 +240,83 @@ def check_ref_keywords(text, seq_value=None, header_text=None, des_text=None, st
 
     # At this point we DO have a primary reference in the text row.
     # Since we removed revision checking, this is always Valid
-    return "Valid"
\ No newline at end of file
+    return "Valid"
+
+def check_ref_keywords_vec(texts, seqs, headers, des_texts):
+    """
+    Vectorized check_ref_keywords() over aligned Series.
+
+    Steps 0-3 (SEQ/header auto-valid, N/A / blank, skip phrases) are
+    evaluated as boolean masks over whole columns; only the remaining
+    rows go through the per-row reference checks (steps 4-6).
+
+    Args:
+        texts: wo_text_action.text values
+        seqs: SEQ values
+        headers: wo_text_action.header values
+        des_texts: DES values
+
+    Returns:
+        pd.Series: Validation reason per row (same index as texts)
+    """
+    reasons = np.empty(len(texts), dtype=object)
+
+    # ========== STEPS 0-1: SEQ / HEADER auto-valid ==========
+    auto_valid = (
+        seqs.map(is_seq_auto_valid).to_numpy(dtype=bool)
+        | header_skip_keyword_mask(headers).to_numpy(dtype=bool)
+    )
+    reasons[auto_valid] = "Valid"
+
+    # Non-string texts (None / NaN) are rare; use the scalar path for them.
+    # A StringDtype column (Arrow-backed input, or pandas 3 str) holds only
+    # str or missing values, so a native notna() replaces the per-row check.
+    if isinstance(texts.dtype, pd.StringDtype):
+        is_str = texts.notna().to_numpy(dtype=bool)
+    else:
+        is_str = texts.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    for i in np.flatnonzero(~auto_valid & ~is_str):
+        reasons[i] = check_ref_keywords(
+            texts.iat[i], seqs.iat[i], headers.iat[i], des_texts.iat[i]
+        )
+
+    todo = np.flatnonzero(~auto_valid & is_str)
+    if len(todo) == 0:
+        return pd.Series(reasons, index=texts.index)
+
+    # ========== STEP 2: Preserve N/A / blank ==========
+    stripped = texts.iloc[todo].str.strip()
+    na_prefix = stripped.str[:5].str.upper().str.contains("N/A", regex=False)
+    blank = stripped.str.upper().isin(["N/A", "NA", "NONE", ""])
+
+    # ========== STEP 3: Skip phrases ==========
+    skip = skip_phrase_mask(stripped)
+
+    na_prefix = na_prefix.to_numpy(dtype=bool)
+    blank = blank.to_numpy(dtype=bool) & ~na_prefix
+    skip = skip.to_numpy(dtype=bool) & ~na_prefix & ~blank
+    rest = ~(na_prefix | blank | skip)
+
+    stripped_values = stripped.to_numpy(dtype=object)
+    reasons[todo[na_prefix]] = "N/A"
+    reasons[todo[blank]] = stripped_values[blank]
+    reasons[todo[skip]] = "Valid"
+
+    # ========== STEPS 4-6: Per-row reference checks ==========
+    # Work packages repeat the same step texts many times; each distinct
+    # (text, SEQ, DES) combination is checked only once.
+    rest_rows = todo[rest]
+    checked = {}
+    results = []
+    for key in zip(
+        stripped_values[rest],
+        seqs.to_numpy(dtype=object)[rest_rows],
+        des_texts.to_numpy(dtype=object)[rest_rows],
+    ):
+        reason = checked.get(key)
+        if reason is None:
+            reason = checked[key] = _check_ref_text(*key)
+        results.append(reason)
+    reasons[rest_rows] = results
+
+    return pd.Series(reasons, index=texts.index)
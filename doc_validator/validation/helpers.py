@@ -3,6 +3,20 @@
 import re
 from typing import Optional
 
+import pandas as pd
+
+from .patterns import (
+    CROSS_REFERENCE_PATTERN,
+    HTML_TAG_PATTERN,
+    MULTI_SPACE_PATTERN,
+    NDT02_REPORT_PATTERN,
+    REF_JOINED_PATTERN,
+    REV_JOINED_PATTERN,
+    REV_SUFFIX_PATTERN,
+    REV_TYPO_PATTERN,
+    WHITESPACE_PATTERN,
+    WHITESPACE_RUN_REGEX,
+)
 from .rule_manager import RuleManager
 
 # Global rule manager instance (initialized at startup)
@@ -36,9 +50,9 @@ def has_valid_execution_response(text: str) -> bool:
     rm = get_rule_manager()
 
     # Strip HTML tags
-    cleaned = re.sub(r'<[^>]+>', ' ', text)
+    cleaned = HTML_TAG_PATTERN.sub(' ', text)
     # Normalize whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = WHITESPACE_PATTERN.sub(' ', cleaned).strip()
     # Convert to uppercase for pattern matching
     cleaned = cleaned.upper()
 
@@ -116,15 +130,42 @@ def contains_header_skip_keyword(header_text) -> bool:
 
     rm = get_rule_manager()
 
+    if rm.header_skip_pattern is None:
+        return False
+
     # Normalize: uppercase and remove extra spaces
     normalized = " ".join(header_text.upper().split())
 
-    # Check against all header skip keywords from DB
-    for keyword in rm.header_skip_keywords:
-        if keyword in normalized:
-            return True
+    # Check against all header skip keywords from DB (one alternation)
+    return bool(rm.header_skip_pattern.search(normalized))
 
-    return False
+
+def header_skip_keyword_mask(headers: pd.Series) -> pd.Series:
+    """
+    Vectorized contains_header_skip_keyword() over a Series of headers.
+
+    Args:
+        headers: wo_text_action.header values
+
+    Returns:
+        pd.Series[bool]: True where the header contains a skip keyword
+    """
+    rm = get_rule_manager()
+    if rm.header_skip_pattern is None:
+        return pd.Series(False, index=headers.index)
+
+    # Same normalization as contains_header_skip_keyword(): every
+    # str.split() whitespace run (NBSP included) becomes one space
+    normalized = (
+        headers.str.upper()
+        .str.replace(WHITESPACE_RUN_REGEX, " ", regex=True)
+        .str.strip()
+    )
+    # Pass the pattern text: Arrow-backed strings (pandas 2.1/2.2) hand it
+    # to pyarrow's RE2 matcher, which rejects compiled re.Pattern objects
+    return normalized.str.contains(
+        rm.header_skip_pattern.pattern, regex=True, na=False
+    ).astype(bool)
 
 
 def fix_common_typos(text: str) -> str:
@@ -136,19 +177,19 @@ def fix_common_typos(text: str) -> str:
 
     t = text
     # Normalize "REV" formats
-    t = re.sub(r"(?i)\bREV[:\.]?\s*(\d+)\b", r"REV \1", t)
-    t = re.sub(r"(?i)\brev(\d+)\b", r"rev \1", t)
-    t = re.sub(r"([A-Za-z0-9\)\]])rev(\d+)\b", r"\1 rev \2", t, flags=re.IGNORECASE)
+    t = REV_TYPO_PATTERN.sub(r"REV \1", t)
+    t = REV_JOINED_PATTERN.sub(r"rev \1", t)
+    t = REV_SUFFIX_PATTERN.sub(r"\1 rev \2", t)
 
     # Space after REF
-    t = re.sub(r"(?i)\bREF([A-Z])", r"REF \1", t)
+    t = REF_JOINED_PATTERN.sub(r"REF \1", t)
 
     # Ensure space after REF keywords when followed by a digit
-    for ref in rm.ref_keywords:
-        t = re.sub(fr"(?i)\b({re.escape(ref)})(\d)", r"\1 \2", t)
+    if rm.ref_digit_pattern is not None:
+        t = rm.ref_digit_pattern.sub(r"\1 \2", t)
 
     # Collapse multiple spaces
-    t = re.sub(r"\s{2,}", " ", t)
+    t = MULTI_SPACE_PATTERN.sub(" ", t)
     return t
 
 
@@ -161,29 +202,29 @@ def contains_skip_phrase(text: str) -> bool:
         return False
 
     rm = get_rule_manager()
-    up = text.upper()
-
-    # Check skip phrases from DB (applies_to='TEXT')
-    for phrase in rm.skip_phrases:
-        if phrase in up:
-            return True
 
-    # Additional hardcoded cross-reference checks
-    # (Can be moved to DB if needed)
+    # Skip phrases from DB (applies_to='TEXT') plus the hardcoded
+    # cross-Workstep / cross-Workorder references, as one alternation
+    pattern = rm.skip_phrase_pattern or CROSS_REFERENCE_PATTERN
+    return bool(pattern.search(text.upper()))
 
-    # Cross-Workstep (WT) references
-    if "REFER RESULT WT" in up or "REFER WT " in up:
-        return True
 
-    # Cross-Workorder (WO) references
-    if re.search(r"\bWO\s*[:\-]\s*[0-9`' ]+", up):
-        return True
+def skip_phrase_mask(texts: pd.Series) -> pd.Series:
+    """
+    Vectorized contains_skip_phrase() over a Series of texts.
 
-    # WO together with EOD (Engineering Order)
-    if "EOD" in up and re.search(r"\bWO\s*[:\-]\s*[0-9`' ]+", up):
-        return True
+    Args:
+        texts: Action text values
 
-    return False
+    Returns:
+        pd.Series[bool]: True where the text contains a skip phrase
+    """
+    rm = get_rule_manager()
+    pattern = rm.skip_phrase_pattern or CROSS_REFERENCE_PATTERN
+    # Pattern text, not re.Pattern (see header_skip_keyword_mask)
+    return texts.str.upper().str.contains(
+        pattern.pattern, regex=True, na=False
+    ).astype(bool)
 
 
 def has_referenced_pattern(text: str) -> bool:
@@ -290,7 +331,7 @@ def has_ndt02_report(text: str) -> bool:
     if not isinstance(text, str):
         return False
 
-    return bool(re.search(r'\bNDT02-\d{4,}\b', text.upper()))
+    return bool(NDT02_REPORT_PATTERN.search(text.upper()))
 
 
 def has_revision(text: str) -> bool:
@@ -48,4 +48,26 @@ REFERENCED_PATTERN = re.compile(
 # Special document patterns (no explicit REV required)
 NDT_REPORT_PATTERN = re.compile(r'\bNDT\s+REPORT\s+[A-Z0-9\-]+\b', re.IGNORECASE)
 SB_FULL_PATTERN = re.compile(r'\bSB\s+[A-Z0-9]{1,5}-[A-Z0-9\-]+\b', re.IGNORECASE)
-DATA_MODULE_TASK_PATTERN = re.compile(r'\bDATA\s+MODULE\s+TASK\s+\d+\b', re.IGNORECASE)
\ No newline at end of file
+DATA_MODULE_TASK_PATTERN = re.compile(r'\bDATA\s+MODULE\s+TASK\s+\d+\b', re.IGNORECASE)
+# NDT02 inspection report numbers (matched against upper-cased text)
+NDT02_REPORT_PATTERN = re.compile(r'\bNDT02-\d{4,}\b')
+
+# Cross-Workstep (WT) / cross-Workorder (WO) references that skip validation
+# (matched against upper-cased text)
+CROSS_REFERENCE_PATTERN = re.compile(r"REFER RESULT WT|REFER WT |\bWO\s*[:\-]\s*[0-9`' ]+")
+
+# Text normalization used by the helpers
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Runs of the characters str.split() treats as whitespace (str.isspace()),
+# spelled out as a plain string for pandas .str methods: on Arrow-backed
+# strings these run on RE2, whose \s is ASCII-only and misses NBSP etc.
+WHITESPACE_RUN_REGEX = (
+    "[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a"
+    "\u2028\u2029\u202f\u205f\u3000]+"
+)
+MULTI_SPACE_PATTERN = re.compile(r'\s{2,}')
+REV_TYPO_PATTERN = re.compile(r'\bREV[:\.]?\s*(\d+)\b', re.IGNORECASE)
+REV_JOINED_PATTERN = re.compile(r'\brev(\d+)\b', re.IGNORECASE)
+REV_SUFFIX_PATTERN = re.compile(r'([A-Za-z0-9\)\]])rev(\d+)\b', re.IGNORECASE)
+REF_JOINED_PATTERN = re.compile(r'\bREF([A-Z])', re.IGNORECASE)
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 import logging
 
 from .db_connector import DBConnector
+from .patterns import CROSS_REFERENCE_PATTERN
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,9 @@ class RuleManager:
         self.ref_keyword_pattern: Optional[re.Pattern] = None
         self.iaw_keyword_pattern: Optional[re.Pattern] = None
         self.mp_with_context_pattern: Optional[re.Pattern] = None
+        self.ref_digit_pattern: Optional[re.Pattern] = None
+        self.header_skip_pattern: Optional[re.Pattern] = None
+        self.skip_phrase_pattern: Optional[re.Pattern] = None
 
         # Special patterns (built from document types + linking keywords)
         self.referenced_pattern: Optional[re.Pattern] = None
@@ -210,6 +214,22 @@ class RuleManager:
             mp_pattern_str = r'\b(?:' + '|'.join(re.escape(k) for k in self.iaw_keywords) + r')\s+MP\b'
             self.mp_with_context_pattern = re.compile(mp_pattern_str, re.IGNORECASE)
 
+        # REF keyword directly followed by a digit (e.g. "AMM12"), longest first
+        if self.ref_keywords:
+            ref_keywords = sorted(self.ref_keywords, key=len, reverse=True)
+            ref_digit_str = r'\b(' + '|'.join(re.escape(k) for k in ref_keywords) + r')(\d)'
+            self.ref_digit_pattern = re.compile(ref_digit_str, re.IGNORECASE)
+
+        # HEADER skip keywords (matched against upper-cased, space-normalized text)
+        if self.header_skip_keywords:
+            header_skip_str = '|'.join(re.escape(k) for k in self.header_skip_keywords)
+            self.header_skip_pattern = re.compile(header_skip_str)
+
+        # TEXT skip phrases + cross-reference patterns (matched against upper-cased text)
+        skip_parts = [re.escape(p) for p in self.skip_phrases]
+        skip_parts.append(CROSS_REFERENCE_PATTERN.pattern)
+        self.skip_phrase_pattern = re.compile('|'.join(skip_parts))
+
         logger.info("Keyword patterns compiled")
 
     def _build_special_patterns(self) -> None:
@@ -269,4 +289,4 @@ class RuleManager:
     def reload_rules(self) -> None:
         """Reload all rules from database (for runtime updates)."""
         logger.info("Reloading validation rules...")
-        self.load_all_rules()
\ No newline at end of file
+        self.load_all_rules()
\ No newline at end of file
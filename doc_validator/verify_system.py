@@ -177,6 +177,61 @@ def check_validation_functions():
         return False
 
 
+def check_vectorized_masks():
+    """Test the vectorized skip masks on the pipeline's input string dtype."""
+    print("\n" + "=" * 60)
+    print("6. TESTING VECTORIZED SKIP MASKS")
+    print("=" * 60)
+
+    try:
+        import pandas as pd
+
+        from doc_validator.core.excel_io import INPUT_STRING_DTYPE
+        from doc_validator.validation import helpers
+        from doc_validator.validation.rule_manager import RuleManager
+
+        print(f"Input string dtype: {INPUT_STRING_DTYPE}")
+
+        # Small rule set, no database needed
+        rule_manager = RuleManager(db_connector=None)
+        rule_manager.header_skip_keywords = ["CLOSE UP", "OPEN (ACCESS)"]
+        rule_manager.skip_phrases = ["NOT APPLICABLE"]
+        rule_manager._compile_keyword_patterns()
+
+        headers = pd.Series(
+            # NBSP / em space: Unicode whitespace, as in AMOS exports
+            ["close  up panel", "OPEN (ACCESS) 1", "REMOVAL", None,
+             "CLOSE\xa0UP", "close\u2003up", "close\u00a0\tup"],
+            dtype=INPUT_STRING_DTYPE,
+        )
+        texts = pd.Series(
+            ["task not applicable", "REFER WT 3", "IAW AMM 12-34", None],
+            dtype=INPUT_STRING_DTYPE,
+        )
+
+        previous = helpers._rule_manager
+        helpers.initialize_rules(rule_manager)
+        try:
+            header_mask = helpers.header_skip_keyword_mask(headers).tolist()
+            skip_mask = helpers.skip_phrase_mask(texts).tolist()
+            expected_header = [helpers.contains_header_skip_keyword(h) for h in headers]
+            expected_skip = [helpers.contains_skip_phrase(t) for t in texts]
+        finally:
+            helpers._rule_manager = previous
+
+        ok = header_mask == expected_header and skip_mask == expected_skip
+        status = "✓" if ok else "✗"
+        print(f"{status} header_skip_keyword_mask → {header_mask} (expected: {expected_header})")
+        print(f"{status} skip_phrase_mask → {skip_mask} (expected: {expected_skip})")
+        return ok
+
+    except Exception as e:
+        print(f"✗ FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def check_file_structure(project_root):
     """Verify project file structure."""
     print("\n" + "=" * 60)
@@ -293,6 +348,7 @@ def main():
         results.append(("Database Connection", check_database_connection()))
         results.append(("Validation Engine", check_validation_engine()))
         results.append(("Validation Functions", check_validation_functions()))
+        results.append(("Vectorized Skip Masks", check_vectorized_masks()))
 
         # Summary
         print("\n" + "=" * 60)
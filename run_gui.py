@@ -26,11 +26,18 @@ def main():
         "Trusted_Connection=yes;"
     )
 
+    from doc_validator.config import ensure_folders
+    ensure_folders()
+
     # Create Qt Application
     app = QApplication(sys.argv)
     app.setApplicationName("AMOS Documentation Validator")
     app.setStyle("Fusion")
 
+    # Apply the dark theme once, app-wide (panels style via object names)
+    from doc_validator.interface.styles.theme import get_dark_theme_stylesheet
+    app.setStyleSheet(get_dark_theme_stylesheet())
+
     # Initialize validation engine BEFORE starting GUI
     try:
         print("=" * 60)